@@ -0,0 +1,41 @@
+"""On-disk JSON caches shared by dashboard.py and scripts/generate_dashboard.py between runs."""
+import contextlib
+import json
+import os
+
+# Outside dashboard/, which is published as-is, so cache files are neither served nor writable from it
+CACHE_DIR = ".cache"
+
+
+def cache_path(name):
+    """Return the path of a named cache file in CACHE_DIR."""
+    return os.path.join(CACHE_DIR, name)
+
+
+def write_atomic(path, data, mode="wb"):
+    """Write data to a per-process temp file beside path and rename it over path, removing it on failure."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, mode) as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def load_json_cache(path):
+    """Return the dict saved at path by save_json_cache, or {} if it is missing or unreadable."""
+    try:
+        with open(path, "rb") as f:
+            cache = json.loads(f.read())
+        return cache if isinstance(cache, dict) else {}
+    except Exception:
+        return {}
+
+
+def save_json_cache(path, cache):
+    """Atomically replace the cache file at path with cache, creating its directory if needed."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    write_atomic(path, json.dumps(cache), mode="w")
@@ -1,101 +1,39 @@
 import os
+import re
+import html
 from datetime import datetime
 from pathlib import Path
 import shutil
-from jinja2 import Environment, FileSystemLoader
-import glob
+import concurrent.futures
+import contextlib
+import hashlib
+import functools
+import gzip
+from collections import defaultdict
+from typing import List, Optional, Tuple
 
-class ScreenshotDashboard:
-    def __init__(self, screenshots_dir="screenshots", repo_name="Booking"):
-        self.screenshots_dir = screenshots_dir
-        self.template_dir = "templates"
-        self.output_dir = "dashboard"
-        self.repo_name = repo_name
-        
-        # Create output directory if it doesn't exist
-        os.makedirs(self.output_dir, exist_ok=True)
-        os.makedirs(self.template_dir, exist_ok=True)
+import build_cache
 
-    def get_screenshot_data(self):
-        """Get screenshots organized by date and user, showing only booking confirmations."""
-        data = {}
-        
-        # Get all date directories
-        date_dirs = sorted(glob.glob(f"{self.screenshots_dir}/*"), reverse=True)
-        
-        for date_dir in date_dirs:
-            date = os.path.basename(date_dir)
-            try:
-                # Validate date format
-                datetime.strptime(date, "%Y-%m-%d")
-                data[date] = {}
-                
-                # Get all workflow runs for this date
-                workflow_dirs = sorted(glob.glob(f"{date_dir}/workflow_*"))
-                
-                for workflow_dir in workflow_dirs:
-                    workflow_id = os.path.basename(workflow_dir)
-                    
-                    # Get all process directories
-                    process_dirs = glob.glob(f"{workflow_dir}/process_*")
-                    
-                    for process_dir in process_dirs:
-                        # Get all user directories
-                        user_dirs = glob.glob(f"{process_dir}/*")
-                        
-                        for user_dir in user_dirs:
-                            user = os.path.basename(user_dir)
-                            if user not in data[date]:
-                                data[date][user] = []
-                            
-                            # Get only booking confirmation screenshots
-                            confirmation_shots = sorted(glob.glob(f"{user_dir}/*booking_confirmed*.png"))
-                            if not confirmation_shots:  # If no confirmation, try looking for finalization
-                                confirmation_shots = sorted(glob.glob(f"{user_dir}/*finalization*.png"))
-                            
-                            if confirmation_shots:  # Only add if confirmation screenshots exist
-                                # Create GitHub Pages compatible paths
-                                rel_screenshots = [
-                                    f"/{self.repo_name}/screenshots/{os.path.relpath(s, self.screenshots_dir)}"
-                                    for s in confirmation_shots
-                                ]
-                                data[date][user].extend(rel_screenshots)
-                            
-            except ValueError:
-                continue
-                
-        # Clean up empty dates and users
-        data = {
-            date: {
-                user: screenshots 
-                for user, screenshots in users.items() 
-                if screenshots
-            }
-            for date, users in data.items()
-        }
-        data = {date: users for date, users in data.items() if users}
-        
-        return data
+try:
+    from PIL import Image
+except ImportError:  # Thumbnails are optional, the grid falls back to full-size screenshots
+    Image = None
 
-    def generate_dashboard(self):
-        """Generate HTML dashboard."""
-        # Copy screenshots to output directory
-        if os.path.exists(self.screenshots_dir):
-            dest_screenshots = os.path.join(self.output_dir, "screenshots")
-            if os.path.exists(dest_screenshots):
-                shutil.rmtree(dest_screenshots)
-            shutil.copytree(self.screenshots_dir, dest_screenshots)
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
 
-        # Get screenshot data
-        screenshot_data = self.get_screenshot_data()
+# Screenshot date directories are named YYYY-MM-DD
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
-        # Update template with base URL handling
-        template_content = """
+# Static page header; {repo_name} is substituted once per render for base URL handling
+_HEADER = """
 <!DOCTYPE html>
 <html>
 <head>
     <title>Booking Screenshots Dashboard</title>
-    <base href="/{{ repo_name }}/">
+    <base href="/{repo_name}/">
     <style>
         body { font-family: Arial, sans-serif; margin: 20px; }
         .date-section { margin-bottom: 30px; }
@@ -123,6 +61,7 @@ class ScreenshotDashboard:
         }
         .screenshot img {
             max-width: 100%;
+            height: auto;
             border: 1px solid #ddd;
             border-radius: 4px;
         }
@@ -154,28 +93,9 @@ class ScreenshotDashboard:
 </head>
 <body>
     <h1>Booking Screenshots Dashboard</h1>
-    {% for date, users in screenshots.items() %}
-    <div class="date-section">
-        <div class="date-header">
-            <h2>{{ date }}</h2>
-        </div>
-        {% for user, images in users.items() %}
-        <div class="user-section">
-            <div class="user-header">
-                <h3>{{ user }}</h3>
-            </div>
-            <div class="screenshots">
-                {% for image in images %}
-                <div class="screenshot" onclick="showModal('{{ image }}')">
-                    <img src="{{ image }}" alt="{{ image.split('/')[-1] }}">
-                </div>
-                {% endfor %}
-            </div>
-        </div>
-        {% endfor %}
-    </div>
-    {% endfor %}
+"""
 
+_FOOTER = """
     <div id="imageModal" class="modal" onclick="hideModal()">
         <img class="modal-content" id="modalImage">
     </div>
@@ -196,19 +116,432 @@ class ScreenshotDashboard:
 </html>
 """
 
-        # Save template
-        template_path = os.path.join(self.template_dir, "dashboard.html")
-        with open(template_path, "w") as f:
-            f.write(template_content)
-
-        # Generate dashboard
-        env = Environment(loader=FileSystemLoader(self.template_dir))
-        template = env.get_template("dashboard.html")
-        
-        dashboard_html = template.render(screenshots=screenshot_data, repo_name=self.repo_name)
-        
-        with open(os.path.join(self.output_dir, "index.html"), "w") as f:
-            f.write(dashboard_html)
+# Collapse whitespace in the static markup once at import time. Every script statement ends with a
+# semicolon, so joining the lines is safe.
+_HEADER = re.sub(r"\s+", " ", _HEADER).strip() + "\n"
+_FOOTER = re.sub(r"\s+", " ", _FOOTER).strip() + "\n"
+
+
+def render_dashboard(screenshot_data, fp, repo_name):
+    """
+    Write the dashboard HTML for collected screenshot data to an open text file.
+
+    Args:
+        screenshot_data: [(date, [(user, [(thumbnail path, screenshot path, file name)])])]
+        fp: Writable text file
+        repo_name: Repository name used for the page's base URL
+    """
+    fp.write(_HEADER.replace("{repo_name}", repo_name))
+    for date, users in screenshot_data:
+        chunks = [f'<div class="date-section"><div class="date-header"><h2>{html.escape(date)}</h2></div>\n']
+        for user, images in users:
+            chunks.append(
+                f'<div class="user-section"><div class="user-header"><h3>{html.escape(user)}</h3></div>'
+                '<div class="screenshots">\n'
+            )
+            # Paths are built from server-side directory names, so only the alt text needs escaping.
+            # The grid shows the thumbnail and the modal opens the full-size screenshot.
+            chunks.extend(
+                f'<div class="screenshot" onclick="showModal(\'{image}\')">'
+                f'<img src="{thumb}" alt="{html.escape(name)}" loading="lazy" decoding="async" width="300" height="200">'
+                '</div>\n'
+                for thumb, image, name in images
+            )
+            chunks.append('</div></div>\n')
+        chunks.append('</div>\n')
+        fp.writelines(chunks)
+    fp.write(_FOOTER)
+
+
+# FICLONE ioctl from linux/fs.h, clones a file copy-on-write on btrfs/xfs without moving data
+_FICLONE = getattr(fcntl, "FICLONE", 0x40049409)
+
+
+def _copy_file(src, dest):
+    """Copy a file with its metadata, preferring a reflink clone when the filesystem supports it."""
+    if fcntl is not None:
+        try:
+            with open(src, "rb") as src_f, open(dest, "wb") as dest_f:
+                fcntl.ioctl(dest_f.fileno(), _FICLONE, src_f.fileno())
+            shutil.copystat(src, dest)
+            return
+        except OSError:
+            pass
+    shutil.copy2(src, dest)
+
+
+# Bounding box for grid thumbnails, roughly 2x the 300px tile width for high-DPI screens
+_THUMBNAIL_SIZE = (600, 600)
+
+
+def _make_thumbnail(src, dest):
+    """Write a WebP thumbnail of src to dest, returning False if the image can't be read."""
+    # Save beside dest and rename into place: a truncated thumbnail would be newer than its source
+    # and never rebuilt
+    tmp_path = f"{dest}.{os.getpid()}.tmp"
+    try:
+        with Image.open(src) as im:
+            im.thumbnail(_THUMBNAIL_SIZE)
+            im.save(tmp_path, "WEBP", quality=75, method=4)
+        os.replace(tmp_path, dest)
+        return True
+    except Exception:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        return False
+
+
+class _ListingCache:
+    """
+    Memoise directory listings against each directory's mtime.
+
+    A directory's mtime changes whenever an entry is added, removed or renamed, so an unchanged
+    mtime means the cached listing is still valid. Only paths visited in this run are kept in
+    entries, which drops directories that have since been deleted.
+    """
+
+    def __init__(self, previous=None):
+        self.previous = previous or {}
+        self.entries = {}
+
+    def get(self, path, scan, handle=None):
+        """
+        Return scan(handle), reusing the previous result for path while the directory is unchanged.
+
+        handle is an open directory fd (or the path itself, the default) used for the stat and scan.
+        """
+        if handle is None:
+            handle = path
+        try:
+            mtime = os.stat(handle).st_mtime_ns
+        except OSError:
+            return []
+        cached = self.previous.get(path)
+        if cached is not None and cached[0] == mtime:
+            result = cached[1]
+        else:
+            result = scan(handle)
+        self.entries[path] = (mtime, result)
+        return result
+
+
+# Walk with directory fds where the platform allows it, so each level is opened relative to its
+# parent and the kernel doesn't re-resolve the whole path prefix on every stat/scandir
+_USE_DIR_FDS = os.scandir in os.supports_fd and os.open in os.supports_dir_fd
+
+
+def _child_dirs(parent_path, parent_handle, names):
+    """
+    Yield (name, path, handle) for each named child directory, skipping ones that can't be opened.
+
+    handle is an fd opened relative to parent_handle where supported, otherwise the joined path.
+    Each fd is closed once the caller moves on to the next child.
+    """
+    for name in names:
+        path = f"{parent_path}/{name}"
+        if not _USE_DIR_FDS:
+            yield name, path, path
+            continue
+        try:
+            fd = os.open(name, os.O_RDONLY | os.O_DIRECTORY, dir_fd=parent_handle)
+        except OSError:
+            continue
+        try:
+            yield name, path, fd
+        finally:
+            os.close(fd)
+
+
+def _subdirs(directory, prefix="", pattern=None):
+    """
+    Return the subdirectory names of a directory (path or fd), or an empty list if it can't be read.
+
+    Names are checked against prefix/pattern before is_dir(), so unrelated siblings never
+    cost a stat on filesystems that don't report the entry type.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [
+                entry.name for entry in entries
+                if entry.name.startswith(prefix)
+                and (pattern is None or pattern.match(entry.name))
+                and entry.is_dir(follow_symlinks=False)
+            ]
+    except OSError:
+        return []
+
+
+# Per-level listers, built once at import time rather than once per directory visited
+_date_dirs = functools.partial(_subdirs, pattern=_DATE_RE)
+_workflow_dirs = functools.partial(_subdirs, prefix='workflow_')
+_process_dirs = functools.partial(_subdirs, prefix='process_')
+
+
+def _confirmation_shots(user_dir):
+    """Return the names of the booking confirmation screenshots in a user directory, falling back to finalization shots."""
+    try:
+        with os.scandir(user_dir) as entries:
+            pngs = [entry.name for entry in entries if entry.name.endswith('.png') and entry.is_file()]
+    except OSError:
+        return []
+
+    shots = sorted(name for name in pngs if 'booking_confirmed' in name)
+    if not shots:  # If no confirmation, try looking for finalization
+        shots = sorted(name for name in pngs if 'finalization' in name)
+    return shots
+
+
+def _scan_date(date_dir, cache, prefix_len, url_prefix):
+    """Collect confirmation screenshots for every user under a single date directory."""
+    users = defaultdict(list)
+    date = os.path.basename(date_dir)
+
+    if _USE_DIR_FDS:
+        try:
+            date_fd = os.open(date_dir, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return date, []
+    else:
+        date_fd = date_dir
+
+    try:
+        # Get all workflow runs for this date
+        workflow_dirs = sorted(cache.get(date_dir, _workflow_dirs, date_fd))
+
+        for _, workflow_dir, workflow_fd in _child_dirs(date_dir, date_fd, workflow_dirs):
+            # Get all process directories
+            process_dirs = cache.get(workflow_dir, _process_dirs, workflow_fd)
+
+            for _, process_dir, process_fd in _child_dirs(workflow_dir, workflow_fd, process_dirs):
+                # Get all user directories
+                user_dirs = [user for user in cache.get(process_dir, _subdirs, process_fd) if not user.startswith('.')]
+
+                for user, user_dir, user_fd in _child_dirs(process_dir, process_fd, user_dirs):
+                    # Get only booking confirmation screenshots
+                    confirmation_shots = cache.get(user_dir, _confirmation_shots, user_fd)
+
+                    if confirmation_shots:  # Only add if confirmation screenshots exist
+                        # Create GitHub Pages compatible paths, keeping the file name for the alt text
+                        user_url = url_prefix + user_dir[prefix_len:].replace(os.sep, "/")
+                        rel_screenshots = [
+                            (f"{user_url}/{name}", name)
+                            for name in confirmation_shots
+                        ]
+                        users[user].extend(rel_screenshots)
+    finally:
+        if _USE_DIR_FDS:
+            os.close(date_fd)
+
+    # Only users with screenshots were ever added, so flatten straight into render order
+    return date, list(users.items())
+
+
+def collect_screenshots(root: str, url_prefix: str, cache: Optional[_ListingCache] = None) -> List[Tuple[str, List[Tuple[str, List[Tuple[str, str]]]]]]:
+    """
+    Walk a screenshots tree and collect booking confirmations by date and user.
+
+    Kept free of class state so the hot traversal can be compiled (e.g. with mypyc) or run
+    under PyPy without touching ScreenshotDashboard.
+
+    Args:
+        root: Screenshots directory laid out as date/workflow_*/process_*/user/*.png
+        url_prefix: Prefix prepended to each screenshot's path relative to root
+        cache: Listing cache from a previous run, so unchanged directories skip their rescan
+
+    Returns:
+        List of (date, [(user, [(screenshot path, file name)])]) tuples, newest date first
+    """
+    if cache is None:
+        cache = _ListingCache()
+    # Every screenshot path starts with the root directory, so strip it once instead of relpath
+    prefix_len = len(os.path.join(root, ""))
+    scan = functools.partial(_scan_date, cache=cache, prefix_len=prefix_len, url_prefix=url_prefix)
+
+    # Get all date directories
+    date_dirs = []
+    # Validate date format, only paying for strptime once the cheap shape check passes
+    for date in sorted(cache.get(root, _date_dirs), reverse=True):
+        try:
+            datetime.strptime(date, "%Y-%m-%d")
+        except ValueError:
+            continue
+        date_dirs.append(os.path.join(root, date))
+
+    # Date directories are independent, so walk them concurrently while threads block on filesystem calls
+    if len(date_dirs) <= 1:
+        results = [scan(date_dir) for date_dir in date_dirs]
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, len(date_dirs))) as executor:
+            results = list(executor.map(scan, date_dirs))
+
+    # Clean up empty dates
+    return [(date, users) for date, users in results if users]
+
+
+class ScreenshotDashboard:
+    def __init__(self, screenshots_dir="screenshots", repo_name="Booking"):
+        self.screenshots_dir = screenshots_dir
+        self.output_dir = "dashboard"
+        self.repo_name = repo_name
+        self.scan_cache_file = build_cache.cache_path("scan_cache.json")
+
+        # Create output directory if it doesn't exist
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._scan_cache = self._load_scan_cache()
+
+    def _load_scan_cache(self):
+        """Load the previous run's {directory path: [mtime_ns, entry names]} map, or {} if missing or corrupt."""
+        return build_cache.load_json_cache(self.scan_cache_file)
+
+    def _save_scan_cache(self):
+        """Write this run's directory listings, keyed by path and stamped with each directory's mtime_ns."""
+        build_cache.save_json_cache(self.scan_cache_file, self._scan_cache)
+
+    def _sync_screenshots(self, src_dir, dest_dir):
+        """Incrementally mirror src_dir into dest_dir, only linking files that changed and removing stale ones."""
+        os.makedirs(dest_dir, exist_ok=True)
+
+        # List the destination once up front so lookups reuse the cached dirents instead of a stat per file
+        with os.scandir(dest_dir) as entries:
+            existing = {entry.name: entry for entry in entries}
+
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                dest_entry = existing.pop(entry.name, None)
+                dest = f"{dest_dir}/{entry.name}"
+                if entry.is_dir(follow_symlinks=False):
+                    if dest_entry is not None and not dest_entry.is_dir(follow_symlinks=False):
+                        os.unlink(dest)
+                    self._sync_screenshots(entry.path, dest)
+                elif entry.is_file():
+                    self._sync_file(entry, dest_entry, dest)
+                elif dest_entry is not None:
+                    # Not something we mirror, so treat the destination copy as stale
+                    existing[entry.name] = dest_entry
+
+        # Remove anything that no longer exists in the source tree
+        for entry in existing.values():
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+
+    def _sync_file(self, src_entry, dest_entry, dest):
+        """Hardlink a single file into place, falling back to a copy across filesystems."""
+        if dest_entry is not None:
+            if dest_entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(dest)
+            else:
+                src_stat = src_entry.stat()
+                dest_stat = dest_entry.stat(follow_symlinks=False)
+                if (dest_stat.st_ino, dest_stat.st_dev) == (src_stat.st_ino, src_stat.st_dev):
+                    return
+                if dest_stat.st_size == src_stat.st_size and dest_stat.st_mtime_ns >= src_stat.st_mtime_ns:
+                    return
+                os.unlink(dest)
+
+        try:
+            os.link(src_entry.path, dest)
+        except OSError:
+            # Cross-device or unsupported filesystem, copy instead
+            _copy_file(src_entry.path, dest)
+
+    def get_screenshot_data(self):
+        """
+        Get screenshots organized by date and user, showing only booking confirmations.
+
+        Returns:
+            List of (date, [(user, [(screenshot path, file name)])]) tuples, newest date first
+        """
+        cache = _ListingCache(self._scan_cache)
+        data = collect_screenshots(self.screenshots_dir, f"/{self.repo_name}/screenshots/", cache)
+        self._scan_cache = cache.entries
+        self._save_scan_cache()
+        return data
+
+    def _add_thumbnails(self, screenshot_data):
+        """
+        Attach a small thumbnail to every screenshot so the grid doesn't load full-size PNGs.
+
+        Thumbnails are only re-encoded when missing or older than their screenshot, and fall back
+        to the full image when Pillow isn't installed or the screenshot can't be decoded.
+
+        Returns:
+            Same layout as get_screenshot_data, with images as (thumbnail path, screenshot path, file name)
+        """
+        if Image is None:
+            return [
+                (date, [(user, [(image, image, name) for image, name in images]) for user, images in users])
+                for date, users in screenshot_data
+            ]
+
+        thumbs_dir = os.path.join(self.output_dir, "thumbs")
+        os.makedirs(thumbs_dir, exist_ok=True)
+        url_prefix = f"/{self.repo_name}/screenshots/"
+        thumb_prefix = f"/{self.repo_name}/thumbs/"
+
+        # Work out which thumbnails are missing or stale
+        thumb_names = {}
+        pending = []
+        for _, users in screenshot_data:
+            for _, images in users:
+                for image, _ in images:
+                    rel = image[len(url_prefix):]
+                    thumb_name = hashlib.sha1(rel.encode()).hexdigest() + ".webp"
+                    thumb_names[image] = thumb_name
+                    src = os.path.join(self.screenshots_dir, rel)
+                    dest = os.path.join(thumbs_dir, thumb_name)
+                    try:
+                        if os.stat(dest).st_mtime_ns >= os.stat(src).st_mtime_ns:
+                            continue
+                    except OSError:
+                        pass
+                    pending.append((image, src, dest))
+
+        # Image encoding is CPU-bound, so spread it across processes
+        failed = set()
+        if pending:
+            with concurrent.futures.ProcessPoolExecutor() as executor:
+                results = executor.map(_make_thumbnail, [src for _, src, _ in pending], [dest for _, _, dest in pending])
+                failed = {image for (image, _, _), ok in zip(pending, results) if not ok}
+
+        # Remove thumbnails for screenshots that are gone
+        wanted = set(thumb_names.values())
+        with os.scandir(thumbs_dir) as entries:
+            for entry in entries:
+                if entry.name not in wanted:
+                    os.unlink(entry.path)
+
+        return [
+            (date, [
+                (user, [
+                    (image if image in failed else thumb_prefix + thumb_names[image], image, name)
+                    for image, name in images
+                ])
+                for user, images in users
+            ])
+            for date, users in screenshot_data
+        ]
+
+    def generate_dashboard(self):
+        """Generate HTML dashboard."""
+        # Mirror screenshots into the output directory
+        if os.path.exists(self.screenshots_dir):
+            dest_screenshots = os.path.join(self.output_dir, "screenshots")
+            self._sync_screenshots(self.screenshots_dir, dest_screenshots)
+
+        # Get screenshot data
+        screenshot_data = self._add_thumbnails(self.get_screenshot_data())
+
+        # Generate dashboard, streaming it straight to disk instead of building the whole page in memory
+        index_path = os.path.join(self.output_dir, "index.html")
+        with open(index_path, "w", buffering=1 << 20) as f:
+            render_dashboard(screenshot_data, f, self.repo_name)
+
+        # Pre-compress a sibling copy so static hosts can serve it with Content-Encoding: gzip.
+        # mtime=0 keeps the output byte-identical when the page hasn't changed.
+        with open(index_path, "rb") as src, gzip.GzipFile(f"{index_path}.gz", "wb", compresslevel=9, mtime=0) as dest:
+            shutil.copyfileobj(src, dest, 1 << 20)
 
 if __name__ == "__main__":
     dashboard = ScreenshotDashboard()
@@ -4,22 +4,500 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, StaleElementReferenceException, WebDriverException,
+    SessionNotCreatedException, NoSuchDriverException
+)
 import time
 import logging
+import logging.handlers
+import queue
 import configparser
 import os
+import shutil
+import re
+import html
+import requests
+from urllib.parse import urlparse
 from datetime import datetime, timedelta
 import pytz
 import argparse
 import concurrent.futures
-from typing import Dict, List, Tuple
+import multiprocessing.util
+import contextlib
+import functools
+from collections import deque
+import threading
+from typing import Dict, List, Optional, Tuple
 import traceback
 
 
+# Locators reused on every booking. CSS maps straight onto querySelector in the browser, which is
+# cheaper than evaluating XPath; XPath is kept only where matching on text is required.
+_SEL_BOOKABLE_SLOTS = (By.CSS_SELECTOR, "a[data-tooltip*='Book Now']")
+_SEL_DATEPICKER_BUTTON = (By.CSS_SELECTOR, "button[class*='datepicker-button']")
+_SEL_DATEPICKER_DONE = (By.XPATH, "//button[contains(@class, 'datepicker-button-primary') and contains(text(), 'Done')]")
+_SEL_SEARCH_BUTTON = (By.CSS_SELECTOR, "button[id*='frwebsearch_buttonsearch']")
+_SEL_DATEBLOCK = (By.CLASS_NAME, "dateblock")
+_SEL_FIELD_HOUSE_TILE = (By.XPATH, "//a[contains(@class, 'tile')]//h2[contains(text(), 'Field House Courts')]/ancestor::a")
+_SEL_ADD_TO_CART = (By.XPATH, "//button[contains(@class, 'multiselectlist__addbutton') and .//span[contains(text(), 'Add To Cart')]]")
+_SEL_EMPTY_CART = (By.ID, "webcart_buttonemptycart")
+_SEL_CHECKOUT = (By.ID, "webcart_buttoncheckout")
+_SEL_CHECKOUT_CONTINUE = (By.ID, "webcheckout_buttoncontinue")
+_SEL_USER_MENU = (By.XPATH, "//span[contains(@class, 'menuitem__title') and contains(., '#')]")
+_SEL_LOGIN_USERNAME = (By.ID, "weblogin_username")
+_SEL_LOGIN_PASSWORD = (By.ID, "weblogin_password")
+_SEL_LOGIN_BUTTON = (By.ID, "weblogin_buttonlogin")
+_SEL_RESUME_SESSION = (By.ID, "loginresumesession_buttoncontinue")
+_SEL_HOME_LINK = (By.XPATH, "//a[contains(@class, 'menuitem')]//span[contains(@class, 'menuitem__text') and text()='Home']")
+_SEL_FACILITY_SEARCH = (By.XPATH, "//*[contains(text(), 'Facility Search')]")
+_SEL_RESULT_CONTENT = (By.CLASS_NAME, "result-content")
+_SEL_CART_ITEMS = (By.CSS_SELECTOR, "div[class*='cart-item']")
+_SEL_PROCESSING_HEADER = (By.ID, "processingprompts_header")
+_SEL_CONTINUE_BUTTONS = (
+    By.XPATH,
+    "//button[contains(text(), 'Continue') or contains(text(), 'Next')] | //input[@value='Continue' or @value='Next']"
+)
+_SEL_CONFIRMATION_TEXT = (
+    By.XPATH,
+    "//*[contains(text(), 'complete') or contains(text(), 'successful') or contains(text(), 'thank you')]"
+)
+_SEL_CONFIRMATION_NUMBER = (By.CSS_SELECTOR, "div.paragraph#webconfirmation_emailtext h3")
+_SEL_LOGOUT_OPTION = (By.XPATH, "//span[contains(@class, 'menuitem__text') and text()='Logout']")
+_SEL_LOGOUT_LINK = (By.XPATH, "//a[contains(text(), 'Log Out') or contains(text(), 'Logout')]")
+_SEL_SIGN_IN = (By.XPATH, "//span[@class='menuitem__text' and text()='Sign In / Register']")
+
+# Hidden fields (CSRF token and friends) that must be echoed back when posting the login form
+_HIDDEN_INPUT_RE = re.compile(r"<input\b[^>]*\btype=[\"']hidden[\"'][^>]*>", re.IGNORECASE)
+_INPUT_ATTR_RE = re.compile(r"\b(name|value)=[\"']([^\"']*)[\"']", re.IGNORECASE)
+
+# Month labels as the datepicker's month dropdown shows them
+_MONTH_NAMES = ("January", "February", "March", "April", "May", "June",
+                "July", "August", "September", "October", "November", "December")
+
+# Timezone the booking window is counted in, looked up once instead of on every date calculation
+_BOOKING_TZ = pytz.timezone('America/St_Johns')
+
+# Leading "6", "6:30" or "6:30pm" of a whitespace-stripped start time
+_TIME_RE = re.compile(r"(\d{1,2})(?::(\d{2}))?([ap]m)?")
+# (start hour, am/pm) -> compiled slot pattern, filled in by _slot_pattern as hours are seen
+_SLOT_TABLE: Dict[Tuple[int, str], "re.Pattern[str]"] = {}
+
+# Plain-dict copy of config.ini, filled on first use by read_config()
+_CONFIG_CACHE: Optional[Dict[str, Dict[str, str]]] = None
+_CONFIG_LOCK = threading.Lock()
+
+# Cold-start flags that turn off background services, updaters and first-run UI the booking flow never uses
+_CHROME_STARTUP_ARGS = (
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-breakpad",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-features=Translate,BackForwardCache,OptimizationHints",
+    "--disable-sync",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--password-store=basic",
+)
+
+# Rotating log file handler per user prefix, shared by every booker for that user in this process
+_LOG_HANDLERS: Dict[str, logging.Handler] = {}
+_LOG_HANDLERS_LOCK = threading.Lock()
+
+# Screenshots still taken without --all-screenshots (besides every *_error shot); the dashboard
+# shows booking_confirmed, falling back to pre_finalization
+_CHECKPOINT_SCREENSHOTS = frozenset({"login_success", "pre_finalization", "booking_confirmed"})
+
+# Screenshot PNGs are written off the booking thread; two writers keep up with every booker in a process
+_SCREENSHOT_WRITER = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="screenshot")
+
+# Bookings a pooled browser serves before it is quit and relaunched, to cap memory growth
+BROWSER_POOL_RECYCLE_AFTER = 100
+
+# Live browser sessions allowed against the same booking host at once; extra users wait their turn
+MAX_SESSIONS_PER_HOST = 4
+_HOST_SEMAPHORES: Dict[str, threading.BoundedSemaphore] = {}
+_HOST_SEMAPHORES_LOCK = threading.Lock()
+
+# One warm browser per --processes worker, set up by _init_worker and reused for each booking it runs
+_WORKER_POOL: Optional["WebDriverPool"] = None
+
+# Per-user Chrome profiles used with --keep-session
+_CHROME_PROFILES_DIR = "chrome_profiles"
+
+# Third-party requests the booking flow never needs, blocked through CDP to speed up page loads
+_BLOCKED_URL_PATTERNS = [
+    '*google-analytics*',
+    '*googletagmanager*',
+    '*doubleclick*',
+    '*facebook.net*',
+    '*hotjar*',
+    '*segment.io*',
+    '*.woff2',
+    '*.woff',
+    '*.ttf',
+]
+
+# Reads the title, description and slots (matched by the CSS selector in arguments[0]) of every
+# .result-content on the page. Slot elements come back as WebElements so the chosen one can be
+# clicked without another lookup; slot text has its whitespace collapsed.
+_SCRAPE_COURTS_JS = """
+const text = (root, selector) => {
+    const el = root.querySelector(selector);
+    return el ? el.innerText.trim() : null;
+};
+return Array.from(document.querySelectorAll(".result-content")).map(court => ({
+    title: text(court, "h2 > span"),
+    description: text(court, "div[class*='result-header__description']"),
+    slots: Array.from(court.querySelectorAll(arguments[0])).map(slot => ({
+        element: slot,
+        text: slot.innerText.replace(/\\s+/g, " ").trim(),
+        tooltip: slot.getAttribute("data-tooltip")
+    }))
+}));
+"""
+
+# Returns the menu's cart entry when its label reports items (e.g. "Cart 2 Items"), otherwise null.
+_CART_WITH_ITEMS_JS = """
+const labels = Array.from(document.querySelectorAll("a[class*='menuitem--has-twolines'][href*='cart.html'] span"))
+    .filter(span => span.textContent.includes("Cart"));
+return labels.some(span => span.textContent.includes("Items")) ? labels[0] : null;
+"""
+
+# Finds the visible datepicker option whose data-value or whitespace-normalized label equals arguments[0].
+_FIND_OPTION_JS = """
+const value = arguments[0];
+return Array.from(document.querySelectorAll("li[role='option']")).find(option => {
+    if (option.offsetParent === null) {
+        return false;
+    }
+    if (option.getAttribute("data-value") === value) {
+        return true;
+    }
+    const label = option.querySelector("span[class*='listitem__text']");
+    return label !== null && label.textContent.replace(/\\s+/g, " ").trim() === value;
+}) || null;
+"""
+
+# Booking form question inputs for the contact number and the reason for booking
+_CELL_NUMBER_FIELD = "question150906610"
+_BOOKING_REASON_FIELD = "question150906642"
+
+# Sets each [id, value] pair in arguments[0] through the native value setter and fires input/change
+# so the form's own scripts see the answer. Returns the ids of any inputs that were not found.
+_FILL_FIELDS_JS = """
+const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value").set;
+const missing = [];
+for (const [id, value] of arguments[0]) {
+    const el = document.getElementById(id);
+    if (!el) {
+        missing.push(id);
+        continue;
+    }
+    setValue.call(el, value);
+    el.dispatchEvent(new Event("input", {bubbles: true}));
+    el.dispatchEvent(new Event("change", {bubbles: true}));
+}
+return missing;
+"""
+
+# Opens each datepicker dropdown and clicks its matching visible option in one browser turn.
+# Returns null on success, or a description of the first step that failed; a dropdown opened
+# for an option that is missing is closed again, so the page is left as it was for that step.
+_PICK_DATE_JS = """
+for (const [buttonId, value] of arguments[0]) {
+    const button = document.querySelector(`button[id*='${buttonId}']`);
+    if (!button) {
+        return `dropdown ${buttonId} not found`;
+    }
+    button.click();
+    const option = Array.from(document.querySelectorAll("li[role='option'] span.listitem__text"))
+        .find(span => span.offsetParent !== null && span.textContent.trim() === value);
+    if (!option) {
+        button.click();
+        return `option ${value} not found for ${buttonId}`;
+    }
+    option.click();
+}
+return null;
+"""
+
+# Resolves with the first element matching the [strategy, query] locator in arguments[0] as soon as a
+# MutationObserver sees it, or with null after arguments[1] milliseconds. Only covers the id, css and
+# xpath strategies used by the locators above.
+_WAIT_FOR_ELEMENT_JS = """
+const [[strategy, query], timeoutMs, done] = arguments;
+const find = () => {
+    if (strategy === "id") {
+        return document.getElementById(query);
+    }
+    if (strategy === "xpath") {
+        return document.evaluate(query, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null)
+            .singleNodeValue;
+    }
+    return document.querySelector(query);
+};
+const found = find();
+if (found) {
+    done(found);
+    return;
+}
+const observer = new MutationObserver(() => {
+    const el = find();
+    if (el) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(el);
+    }
+});
+observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+const timer = setTimeout(() => {
+    observer.disconnect();
+    done(null);
+}, timeoutMs);
+"""
+
+# Where the chromedriver path found by Selenium Manager is remembered between runs
+_DRIVER_PATH_CACHE_FILE = ".chromedriver_path"
+
+
+def _resolve_driver_path():
+    """Find chromedriver from CHROMEDRIVER, then PATH, then the path Selenium Manager found on a previous run."""
+    path = os.environ.get("CHROMEDRIVER") or shutil.which("chromedriver")
+    if path:
+        return path
+    try:
+        with open(_DRIVER_PATH_CACHE_FILE) as f:
+            cached = f.read().strip()
+    except OSError:
+        return None
+    return cached if cached and os.access(cached, os.X_OK) else None
+
+
+# Resolved once per process and shared by every browser launched from it
+_DRIVER_PATH = _resolve_driver_path()
+
+
+def launch_browser(headless=False, suppress_console=False, take_screenshots=False, profile_dir=None, logger=None):
+    """
+    Start a Chrome session configured for the booking flow.
+
+    Args:
+        headless (bool): Run browser without GUI
+        suppress_console (bool): Minimize console output
+        take_screenshots (bool): Keep images enabled so captured pages render normally
+        profile_dir (str): Persistent user-data-dir to use instead of a throwaway profile
+        logger (logging.Logger): Where to report non-fatal setup problems
+
+    Returns:
+        WebDriver: The started browser
+    """
+    logger = logger or logging.getLogger(__name__)
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument("--headless=new")  # Use new headless mode
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--start-maximized")
+    for arg in _CHROME_STARTUP_ARGS:
+        chrome_options.add_argument(arg)
+    if profile_dir:
+        chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+
+    # Return from navigations at DOMContentLoaded; every step waits for its own elements anyway
+    chrome_options.page_load_strategy = 'eager'
+    prefs = {"profile.default_content_setting_values.notifications": 2}
+    if not take_screenshots:
+        # The flow only reads form elements, so images are wasted bandwidth unless we're capturing pages
+        prefs["profile.managed_default_content_settings.images"] = 2
+        # Also stop Blink from decoding any image that slips through, e.g. CSS backgrounds
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_experimental_option("prefs", prefs)
+
+    if suppress_console:
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-logging"])
+
+    # A known chromedriver path means Selenium skips its driver lookup; only the first launch may pay for it
+    global _DRIVER_PATH
+    service = Service(executable_path=_DRIVER_PATH, log_output=os.devnull)
+    try:
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+    except (SessionNotCreatedException, NoSuchDriverException) as e:
+        if _DRIVER_PATH is None:
+            raise
+        # Chrome updated past the known chromedriver, or it was removed; forget it and let
+        # Selenium Manager fetch a matching one
+        logger.warning("Chromedriver at %s failed to start, resolving it again: %s", _DRIVER_PATH, e)
+        _DRIVER_PATH = None
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(_DRIVER_PATH_CACHE_FILE)
+        service = Service(log_output=os.devnull)
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+    if _DRIVER_PATH is None and service.path:
+        _DRIVER_PATH = service.path
+        try:
+            with open(_DRIVER_PATH_CACHE_FILE, 'w') as f:
+                f.write(_DRIVER_PATH)
+        except OSError as e:
+            logger.warning("Could not cache chromedriver path: %s", e)
+    # All waiting goes through WebDriverWait; an implicit wait would stack on top and stall negative find_elements checks
+    driver.implicitly_wait(0)
+
+    # Drop analytics, ad and web-font requests at the network layer; none of them affect booking
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        logger.warning("Could not enable request blocking: %s", e)
+
+    return driver
+
+
+def _quit_launched(launch):
+    """Done-callback that quits the browser a launch future produced, if it produced one."""
+    if launch.cancelled() or launch.exception() is not None:
+        return
+    with contextlib.suppress(Exception):
+        launch.result().quit()
+
+
+class WebDriverPool:
+    """Fixed set of warm browsers checked out by bookings and relaunched after heavy use."""
+
+    def __init__(self, size, recycle_after=BROWSER_POOL_RECYCLE_AFTER, **browser_kwargs):
+        """
+        Launch the pool's browsers up front.
+
+        Args:
+            size (int): Number of browsers to keep, normally the number of booking workers
+            recycle_after (int): Bookings a browser serves before it is quit and replaced
+            **browser_kwargs: Arguments passed to launch_browser for every browser
+        """
+        self.recycle_after = recycle_after
+        self.browser_kwargs = browser_kwargs
+        self._uses = {}
+        self._lock = threading.Lock()
+        # None marks a slot whose browser is launched on the next acquire
+        self._idle = queue.Queue()
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=size)
+        launches = [executor.submit(launch_browser, **browser_kwargs) for _ in range(size)]
+        try:
+            for launch in launches:
+                try:
+                    self._idle.put(launch.result())
+                except Exception:
+                    logging.getLogger(__name__).warning("Could not launch pooled browser, retrying on first use",
+                                                        exc_info=True)
+                    self._idle.put(None)
+        except BaseException:
+            # Interrupted mid-launch: quit every browser that started, including ones still starting
+            self._idle = queue.Queue()
+            for launch in launches:
+                launch.cancel()
+                launch.add_done_callback(_quit_launched)
+            raise
+        finally:
+            executor.shutdown(wait=False)
+
+    def acquire(self):
+        """Check out a browser, waiting for one to be released if all are in use."""
+        driver = self._idle.get()
+        if driver is None:
+            try:
+                driver = launch_browser(**self.browser_kwargs)
+            except Exception:
+                self._idle.put(None)
+                raise
+        return driver
+
+    def release(self, driver):
+        """Return a browser to the pool, replacing it once it has served recycle_after bookings or died."""
+        with self._lock:
+            uses = self._uses.get(driver, 0) + 1
+            self._uses[driver] = uses
+        if uses < self.recycle_after and self._healthy(driver):
+            self._idle.put(driver)
+            return
+        with self._lock:
+            del self._uses[driver]
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        self._idle.put(None)
+
+    @staticmethod
+    def _healthy(driver):
+        """Check that a browser still answers, so a crashed Chrome is not handed to the next booking."""
+        try:
+            driver.current_url
+        except WebDriverException:
+            return False
+        return True
+
+    def close(self):
+        """Quit every idle browser; call once all bookings have released theirs."""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if driver is not None:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+
+
+class AdaptiveConcurrency:
+    """AIMD limit on concurrent bookings: creeps up while runs are fast and clean, halves on errors or slowdowns."""
+
+    def __init__(self, maximum, minimum=1, target_latency=120.0, window=5):
+        """
+        Args:
+            maximum (int): Upper bound on concurrent bookings, and the starting limit
+            minimum (int): Lower bound the limit never drops below
+            target_latency (float): Mean booking duration in seconds above which the limit is cut
+            window (int): Number of recent bookings averaged for the latency check
+        """
+        self.maximum = maximum
+        self.minimum = min(minimum, maximum)
+        self.target_latency = target_latency
+        self.limit = float(maximum)
+        self._active = 0
+        self._latencies = deque(maxlen=window)
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        """Block until a booking may start under the current limit."""
+        with self._cond:
+            while self._active >= int(self.limit):
+                self._cond.wait()
+            self._active += 1
+
+    def release(self, latency, failed):
+        """Record a finished booking and adjust the limit: +0.5 when healthy, x0.5 on error or high latency."""
+        with self._cond:
+            self._active -= 1
+            self._latencies.append(latency)
+            mean_latency = sum(self._latencies) / len(self._latencies)
+            if failed or mean_latency > self.target_latency:
+                self.limit = max(self.minimum, self.limit * 0.5)
+            else:
+                self.limit = min(self.maximum, self.limit + 0.5)
+            self._cond.notify_all()
+
+
 class CourtBooker:
-    def __init__(self, user_prefix, headless=False, suppress_console=False, take_screenshots=False, use_config_date=False):
+    # Set once the logs directory has been created by this process
+    _logs_dir_ready = False
+
+    def __init__(self, user_prefix, headless=False, suppress_console=False, take_screenshots=False, use_config_date=False, driver=None, config_obj=None, keep_session=False, logout_on_exit=False, all_screenshots=False, http_login=False):
         """
         Initialize court booking system for a specific user.
 
@@ -29,17 +507,50 @@ class CourtBooker:
             suppress_console (bool): Minimize console output
             take_screenshots (bool): Enable screenshot capture
             use_config_date (bool): Use config date instead of calculated date
+            driver (WebDriver): Existing browser session to reuse instead of launching a new Chrome
+            config_obj (dict): Parsed config.ini sections, as returned by read_config(), to use instead of the cached file
+            keep_session (bool): Keep a persistent per-user Chrome profile and stay logged in between runs
+            logout_on_exit (bool): Log out through the site's menu before closing instead of just dropping the session
+            all_screenshots (bool): Capture every step rather than only checkpoints and errors
+            http_login (bool): Try logging in with a direct form POST before falling back to the browser form
         """
         self.user_prefix = user_prefix
         self.headless = headless
         self.suppress_console = suppress_console
         self.take_screenshots = take_screenshots
+        self.all_screenshots = all_screenshots
+        self._pending_screenshots = []
         self.use_config_date = use_config_date
+        self.keep_session = keep_session
+        self.logout_on_exit = logout_on_exit and not keep_session
+        # Off by default: the POST mirrors the login form's field names, and a mismatch costs a failed login
+        self.http_login = http_login
+        self.log_listener = None
         self.logger = self._setup_logging(suppress_console)
-        self.config = self._load_config()
-        self.logged_in = False
-        self.driver = self._init_browser(headless, suppress_console)
-        self.wait = WebDriverWait(self.driver, 10)
+        try:
+            self.config = self._load_config(config_obj)
+            # Booking settings are fixed for the run, so derive the search values once
+            self._booking = self.config['booking']
+            self._facility = self._booking['facility'].lower()
+            self._target_time_slot = self._build_time_slot(self._booking['time'])
+            self.logged_in = False
+            # Only quit the browser on completion if this booker launched it
+            self.owns_driver = driver is None
+            self.driver = driver if driver is not None else self._init_browser(headless, suppress_console)
+        except BaseException:
+            # The listener thread is otherwise only stopped by execute_booking, which never runs now
+            if self.log_listener:
+                self.log_listener.stop()
+            raise
+        # Poll well below Selenium's 500ms default so waits return soon after the page is ready
+        self.wait = WebDriverWait(
+            self.driver, 10, poll_frequency=0.1,
+            ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)
+        )
+        # Datepicker dropdowns open within a frame or two, so poll them even faster
+        self.fast_wait = WebDriverWait(self.driver, 3, poll_frequency=0.05)
+        # Full page loads are dominated by server latency, so allow longer and poll less often
+        self.slow_wait = WebDriverWait(self.driver, 15, poll_frequency=0.25)
 
     def _setup_logging(self, suppress_console):
         """Set up logging configuration."""
@@ -47,31 +558,38 @@ class CourtBooker:
         logger.setLevel(logging.DEBUG)
 
         try:
-            # Create logs directory if it doesn't exist (thread-safe)
-            os.makedirs('logs', exist_ok=True)
-
             # Remove existing handlers if any
             if logger.hasHandlers():
                 logger.handlers.clear()
 
-            # Create a file handler with unique filename using timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            log_file = f'logs/{self.user_prefix}_{timestamp}.log'
-            file_handler = logging.FileHandler(log_file)
-            file_handler.setLevel(logging.DEBUG)
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+            # One rotating file per user, opened lazily on first write and reused by later bookers for that user
+            with _LOG_HANDLERS_LOCK:
+                file_handler = _LOG_HANDLERS.get(self.user_prefix)
+                if file_handler is None:
+                    if not CourtBooker._logs_dir_ready:
+                        os.makedirs('logs', exist_ok=True)
+                        CourtBooker._logs_dir_ready = True
+                    file_handler = logging.handlers.RotatingFileHandler(
+                        f'logs/{self.user_prefix}.log', maxBytes=5_000_000, backupCount=5, delay=True
+                    )
+                    file_handler.setLevel(logging.DEBUG)
+                    file_handler.setFormatter(formatter)
+                    _LOG_HANDLERS[self.user_prefix] = file_handler
 
             # Create a console handler
             console_handler = logging.StreamHandler()
             console_handler.setLevel(logging.DEBUG if not suppress_console else logging.ERROR)
-
-            # Create a formatter and set it for both handlers
-            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-            file_handler.setFormatter(formatter)
             console_handler.setFormatter(formatter)
 
-            # Add the handlers to the logger
-            logger.addHandler(file_handler)
-            logger.addHandler(console_handler)
+            # Hand records to a background listener so file and console writes stay off the booking thread
+            log_queue = queue.Queue(-1)
+            logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            self.log_listener = logging.handlers.QueueListener(
+                log_queue, file_handler, console_handler, respect_handler_level=True
+            )
+            self.log_listener.start()
 
             return logger
         except Exception as e:
@@ -81,25 +599,26 @@ class CourtBooker:
             formatter = logging.Formatter('%(asctime)s - %(name)s - %(levellevel)s - %(message)s')
             console_handler.setFormatter(formatter)
             logger.addHandler(console_handler)
-            logger.error(f"Failed to setup file logging: {str(e)}")
+            logger.error("Failed to setup file logging: %s", e)
             return logger
 
-    def _load_config(self):
+    def _load_config(self, config=None):
         """Load configuration for a specific user from the config file."""
-        config = configparser.ConfigParser()
-        if not config.read('config.ini'):
-            self.logger.error("config.ini file not found")
-            raise FileNotFoundError("config.ini file not found")
+        if config is None:
+            config = read_config()
+            if config is None:
+                self.logger.error("config.ini file not found")
+                raise FileNotFoundError("config.ini file not found")
 
         # Verify user sections exist
         login_section = f"{self.user_prefix}_LOGIN"
         booking_section = f"{self.user_prefix}_BOOKING"
 
-        if not config.has_section(login_section):
-            self.logger.error(f"Missing login section for user {self.user_prefix}")
+        if login_section not in config:
+            self.logger.error("Missing login section for user %s", self.user_prefix)
             raise ValueError(f"Missing login section for user {self.user_prefix}")
-        if not config.has_section(booking_section):
-            self.logger.error(f"Missing booking section for user {self.user_prefix}")
+        if booking_section not in config:
+            self.logger.error("Missing booking section for user %s", self.user_prefix)
             raise ValueError(f"Missing booking section for user {self.user_prefix}")
 
         return {
@@ -112,32 +631,26 @@ class CourtBooker:
         booking_config = dict(booking_section)
 
         if not self.use_config_date:
-            tz = pytz.timezone('America/St_Johns')
-            booking_date = datetime.now(tz) + timedelta(days=6)
+            booking_date = datetime.now(_BOOKING_TZ) + timedelta(days=6)
             booking_config['date'] = booking_date.strftime("%Y-%m-%d")
 
         return booking_config
 
     def _init_browser(self, headless, suppress_console):
         """Initialize Chrome browser instance."""
-        chrome_options = Options()
-        if headless:
-            chrome_options.add_argument("--headless=new")  # Use new headless mode
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--start-maximized")
-
-        if suppress_console:
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-logging"])
-            os.environ['WDM_LOG_LEVEL'] = '0'
-
-        # Let Selenium automatically find ChromeDriver in PATH
-        return webdriver.Chrome(options=chrome_options)
+        profile_dir = None
+        if self.keep_session:
+            # Cookies, HTTP cache and the login survive between runs in a per-user profile
+            profile_dir = os.path.abspath(os.path.join(_CHROME_PROFILES_DIR, self.user_prefix))
+        return launch_browser(headless, suppress_console, self.take_screenshots, profile_dir, self.logger)
 
     def _take_screenshot(self, name):
         """Take a screenshot and save it to the screenshots directory with thread-safe structure."""
         if not self.take_screenshots:
             return
+        # Outside --all-screenshots runs, only keep the shots the dashboard and debugging rely on
+        if not self.all_screenshots and not (name in _CHECKPOINT_SCREENSHOTS or name.endswith("_error")):
+            return
             
         try:
             # Create date-based directory structure with process ID for parallel safety
@@ -160,10 +673,20 @@ class CourtBooker:
             random_suffix = os.urandom(4).hex()  # Add random suffix to prevent naming conflicts
             file_path = os.path.join(screenshot_path, f"{name}_{timestamp}_{random_suffix}.png")
             
-            self.driver.save_screenshot(file_path)
-            self.logger.info(f"Screenshot saved: {file_path}")
+            # Capture now but write on a background thread so the browser can move on
+            png = self.driver.get_screenshot_as_png()
+            self._pending_screenshots.append(_SCREENSHOT_WRITER.submit(_write_file, file_path, png))
+            self.logger.info("Screenshot saved: %s", file_path)
         except Exception as e:
-            self.logger.error(f"Failed to take screenshot {name}: {str(e)}")
+            self.logger.error("Failed to take screenshot %s: %s", name, e)
+
+    def _flush_screenshots(self):
+        """Wait for queued screenshot writes to land on disk and report any that failed."""
+        for future in concurrent.futures.as_completed(self._pending_screenshots):
+            error = future.exception()
+            if error:
+                self.logger.error("Failed to write screenshot: %s", error)
+        self._pending_screenshots = []
 
     def execute_booking(self):
         """Main execution flow for the booking process."""
@@ -180,12 +703,48 @@ class CourtBooker:
                 return False
             return True
         except Exception as e:
-            self.logger.error(f"Booking failed for {self.user_prefix}: {str(e)}")
+            self.logger.error("Booking failed for %s: %s", self.user_prefix, e)
             return False
         finally:
-            if self.logged_in:
-                self._logout()
-            self.driver.quit()
+            try:
+                # Quitting the browser (or clearing a shared one's state) already drops the session,
+                # so walking the logout menu is only done when asked for
+                if self.logged_in and self.logout_on_exit:
+                    self._logout()
+                if self.owns_driver:
+                    self.driver.quit()
+                else:
+                    # Leave a shared browser clean for whoever uses it next
+                    self._clear_browser_state()
+            except Exception as e:
+                # A cleanup failure must not replace the booking result or skip the flushes below
+                self.logger.error("Browser cleanup failed: %s", e)
+            finally:
+                try:
+                    self._flush_screenshots()
+                finally:
+                    if self.log_listener:
+                        # Flushes any records still queued before the run is reported as finished
+                        self.log_listener.stop()
+
+    def _clear_browser_state(self):
+        """Drop every cookie and the site's web storage so a reused browser carries no session over."""
+        login_url = urlparse(self.config['login']['url'])
+        origins = {f"{login_url.scheme}://{login_url.netloc}"}
+        current_url = urlparse(self.driver.current_url)
+        if current_url.scheme in ("http", "https"):
+            origins.add(f"{current_url.scheme}://{current_url.netloc}")
+        try:
+            # delete_all_cookies() only reaches the current domain; CDP clears the whole cookie jar
+            self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            for origin in origins:
+                self.driver.execute_cdp_cmd(
+                    "Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"}
+                )
+        except WebDriverException as e:
+            self.logger.warning("Could not clear browser state through CDP, clearing current page only: %s", e)
+            self.driver.delete_all_cookies()
+            self.driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
 
     def _login(self):
         """User-specific login implementation with cart checking and clearing."""
@@ -194,53 +753,50 @@ class CourtBooker:
             self.driver.get(login_info['url'])
             self._take_screenshot("login_page")
 
-            # Login form interaction
-            self.wait.until(EC.presence_of_element_located((By.ID, 'weblogin_username'))).send_keys(login_info['username'])
-            self.driver.find_element(By.ID, 'weblogin_password').send_keys(login_info['password'])
-            self._take_screenshot("login_form_filled")
-            self.driver.find_element(By.ID, 'weblogin_buttonlogin').click()
+            if self.keep_session and self._session_active():
+                self.logger.info("Reusing saved session, skipping login form")
+            elif self.http_login and self._login_via_http():
+                self.logger.info("Logged in over HTTP, skipping login form")
+            else:
+                # Login form interaction
+                self._wait_for_element(_SEL_LOGIN_USERNAME).send_keys(login_info['username'])
+                self.driver.find_element(*_SEL_LOGIN_PASSWORD).send_keys(login_info['password'])
+                self._take_screenshot("login_form_filled")
+                self.driver.find_element(*_SEL_LOGIN_BUTTON).click()
 
-            # Handle session warnings
-            try:
-                self.wait.until(EC.presence_of_element_located((By.ID, 'loginresumesession_buttoncontinue'))).click()
-                self._take_screenshot("session_warning")
-            except TimeoutException:
-                pass
+                # Handle session warnings; the dialog is rare, so only probe briefly for it
+                try:
+                    WebDriverWait(self.driver, 0.5, poll_frequency=0.1).until(
+                        EC.presence_of_element_located(_SEL_RESUME_SESSION)
+                    ).click()
+                    self._take_screenshot("session_warning")
+                except TimeoutException:
+                    pass
 
             # Check and clear cart if items exist
             try:
-                cart_items = self.driver.find_elements(
-                    By.XPATH,
-                    "//a[contains(@class, 'menuitem--has-twolines') and contains(@href, 'cart.html')]//span[contains(text(), 'Cart')]"
-                )
+                # One round-trip answers "does the cart hold items" and hands back the link to click if so
+                cart_link = self.driver.execute_script(_CART_WITH_ITEMS_JS)
                 
-                if cart_items and any('Items' in item.text for item in cart_items):
+                if cart_link:
                     self.logger.info("Found existing items in cart")
                     
                     # Click on cart
-                    cart_items[0].click()
-                    time.sleep(1)
+                    self._click_and_wait(cart_link, _SEL_EMPTY_CART)
                     
-                    # Click Empty Cart button
-                    empty_cart_button = self.wait.until(
-                        EC.element_to_be_clickable((By.ID, "webcart_buttonemptycart"))
+                    # Post-login cart actions are quick in-page transitions, so the short wait is enough
+                    empty_cart_button = self.fast_wait.until(
+                        EC.element_to_be_clickable(_SEL_EMPTY_CART)
                     )
-                    empty_cart_button.click()
+                    self._click_and_wait(empty_cart_button)
                     self.logger.info("Cart cleared")
-                    time.sleep(1)
                     
                     # Click Home
-                    home_link = self.wait.until(
-                        EC.element_to_be_clickable((
-                            By.XPATH,
-                            "//a[contains(@class, 'menuitem')]//span[contains(@class, 'menuitem__text') and text()='Home']"
-                        ))
-                    )
-                    home_link.click()
+                    home_link = self.fast_wait.until(EC.element_to_be_clickable(_SEL_HOME_LINK))
+                    self._click_and_wait(home_link, _SEL_FIELD_HOUSE_TILE)
                     self.logger.info("Navigated back to home")
-                    time.sleep(1)
             except Exception as e:
-                self.logger.warning(f"Cart check/clear process encountered an issue: {str(e)}")
+                self.logger.warning("Cart check/clear process encountered an issue: %s", e)
                 # Continue with the login process even if cart clearing fails
 
             self.logged_in = True
@@ -250,8 +806,140 @@ class CourtBooker:
             
         except Exception as e:
             self._take_screenshot("login_error")
-            self.logger.error(f"Login failed: {str(e)}")
+            self.logger.error("Login failed: %s", e)
+            return False
+
+    def _login_via_http(self):
+        """
+        Log in with a plain form POST and hand the resulting session cookies to the browser.
+
+        Returns:
+            bool: True if the browser ends up signed in, False to fall back to the login form
+        """
+        login_info = self.config['login']
+        try:
+            user_agent = self.driver.execute_script("return navigator.userAgent")
+        except WebDriverException as e:
+            self.logger.warning("Could not read browser user agent, using login form: %s", e)
+            return False
+        try:
+            session = requests.Session()
+            session.headers['User-Agent'] = user_agent
+            page = session.get(login_info['url'], timeout=10)
+            page.raise_for_status()
+
+            form = {}
+            for tag in _HIDDEN_INPUT_RE.findall(page.text):
+                attrs = {k.lower(): html.unescape(v) for k, v in _INPUT_ATTR_RE.findall(tag)}
+                if 'name' in attrs:
+                    form[attrs['name']] = attrs.get('value', '')
+            form['weblogin_username'] = login_info['username']
+            form['weblogin_password'] = login_info['password']
+            form['weblogin_buttonlogin'] = 'yes'
+
+            response = session.post(page.url, data=form, timeout=10)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            self.logger.warning("HTTP login failed, using login form: %s", e)
+            return False
+
+        # The resume-session prompt needs a click, which only the browser flow handles
+        if 'loginresumesession_buttoncontinue' in response.text:
+            self.logger.info("HTTP login hit the resume-session prompt, using login form")
+            return False
+
+        # The browser is already on the login page, so the cookies land on the right origin
+        try:
+            for cookie in session.cookies:
+                self.driver.add_cookie({
+                    'name': cookie.name,
+                    'value': cookie.value,
+                    'path': cookie.path or '/',
+                    'secure': bool(cookie.secure),
+                })
+        except WebDriverException as e:
+            self.logger.warning("Could not hand HTTP session to the browser, using login form: %s", e)
+            return False
+        self.driver.get(response.url)
+
+        if not self._session_active():
+            self.logger.warning("HTTP login was not accepted, using login form")
+            self.driver.get(login_info['url'])
+            return False
+        return True
+
+    def _click_and_wait(self, element, next_locator=None, timeout=5):
+        """
+        Click an element, then wait for the page to move on rather than sleeping a fixed second.
+
+        Args:
+            element (WebElement): Element to click
+            next_locator (tuple): Locator of an element expected on the next page state, if known
+            timeout (float): Seconds to wait before carrying on regardless
+        """
+        element.click()
+        # The old page going stale or the next element appearing both mean the transition happened
+        conditions = [EC.staleness_of(element)]
+        if next_locator:
+            conditions.append(EC.presence_of_element_located(next_locator))
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(EC.any_of(*conditions))
+        except TimeoutException:
+            self.logger.warning("Page did not change within %ss of click, continuing", timeout)
+
+    def _wait_for_element(self, locator, timeout=10):
+        """
+        Wait for an element to appear, waking on the DOM mutation that adds it instead of polling.
+
+        Args:
+            locator (tuple): (By, query) locator of the element
+            timeout (float): Seconds to wait before giving up
+
+        Returns:
+            WebElement: The first matching element
+
+        Raises:
+            TimeoutException: If no matching element appeared in time
+        """
+        strategy, query = locator
+        if strategy in (By.ID, By.XPATH, By.CSS_SELECTOR):
+            started = time.monotonic()
+            try:
+                # The script must be allowed to outlive its own timeout so it can report null itself;
+                # the driver may be pooled, so its previous script timeout is put back afterwards
+                previous_timeout = self.driver.timeouts.script
+                self.driver.set_script_timeout(timeout + 5)
+                try:
+                    element = self.driver.execute_async_script(
+                        _WAIT_FOR_ELEMENT_JS, [strategy, query], int(timeout * 1000)
+                    )
+                finally:
+                    self.driver.set_script_timeout(previous_timeout)
+                if element is None:
+                    raise TimeoutException(f"{query} did not appear within {timeout}s")
+                return element
+            except TimeoutException:
+                raise
+            except Exception as e:
+                # A navigation mid-wait tears down the observer's document; poll for the rest of the time
+                self.logger.debug("Event-driven wait for %s failed, polling instead: %s", query, e)
+                timeout = max(timeout - (time.monotonic() - started), 0.5)
+        return WebDriverWait(
+            self.driver, timeout, poll_frequency=0.1,
+            ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)
+        ).until(EC.presence_of_element_located(locator))
+
+    def _session_active(self):
+        """Check whether the loaded page belongs to a signed-in session from a previous run."""
+        try:
+            # Either the login form or the signed-in user menu shows up once the page renders
+            self.wait.until(EC.any_of(
+                EC.presence_of_element_located(_SEL_LOGIN_USERNAME),
+                EC.presence_of_element_located(_SEL_USER_MENU)
+            ))
+        except TimeoutException:
             return False
+        return not self.driver.find_elements(*_SEL_LOGIN_USERNAME)
 
     def _navigate_to_booking(self):
         """Navigate to the booking page and clear any existing selections."""
@@ -259,30 +947,30 @@ class CourtBooker:
             self.logger.info("Navigating to booking page")
             self._take_screenshot("pre_navigation")  # Add screenshot before navigation
             
-            field_house_link = self.wait.until(
-                EC.element_to_be_clickable((By.XPATH, "//a[contains(@class, 'tile')]//h2[contains(text(), 'Field House Courts')]/ancestor::a"))
+            field_house_link = self.slow_wait.until(
+                EC.element_to_be_clickable(_SEL_FIELD_HOUSE_TILE)
             )
             field_house_link.click()
             
-            self.wait.until(EC.presence_of_element_located((By.XPATH, "//*[contains(text(), 'Facility Search')]")))
+            self.slow_wait.until(EC.presence_of_element_located(_SEL_FACILITY_SEARCH))
             self._take_screenshot("booking_page")  # Add screenshot after navigation
             self.logger.info("Booking page loaded successfully")
             return True
         except Exception as e:
             self._take_screenshot("navigation_error")  # Add screenshot on navigation error
-            self.logger.error(f"Failed to navigate to booking page: {str(e)}")
+            self.logger.error("Failed to navigate to booking page: %s", e)
             return False
 
     def _select_date(self):
         """Select the desired booking date using the dropdown selectors."""
         try:
-            desired_date = self.config['booking']['date']
-            self.logger.info(f"Selecting date: {desired_date}")
+            desired_date = self._booking['date']
+            self.logger.info("Selecting date: %s", desired_date)
             self._take_screenshot("pre_date_selection")  # Add screenshot before date selection
 
             # Open datepicker
             date_picker_button = self.wait.until(
-                EC.element_to_be_clickable((By.XPATH, "//button[contains(@class, 'datepicker-button')]"))
+                EC.element_to_be_clickable(_SEL_DATEPICKER_BUTTON)
             )
             date_picker_button.click()
 
@@ -293,157 +981,189 @@ class CourtBooker:
             year_int = int(year)
 
             # Get month name from month number
-            month_names = ["January", "February", "March", "April", "May", "June",
-                        "July", "August", "September", "October", "November", "December"]
-            target_month = month_names[month_int - 1]
-
-            # Select month, day, and year
-            self._select_dropdown_option("month_selection_button", target_month)  # Use month name
-            self._select_dropdown_option("day_selection_button", day_int)
-            self._select_dropdown_option("year_selection_button", year_int)
+            target_month = _MONTH_NAMES[month_int - 1]
+
+            # Select month, day, and year in one browser round-trip, falling back to one dropdown at a time
+            if not self._pick_date_js(year_int, target_month, day_int):
+                selected = (
+                    self._select_dropdown_option("month_selection_button", target_month)  # Use month name
+                    and self._select_dropdown_option("day_selection_button", day_int)
+                    and self._select_dropdown_option("year_selection_button", year_int)
+                )
+                if not selected:
+                    # Searching now would book against whatever date the picker still shows
+                    self._take_screenshot("date_selection_error")
+                    self.logger.error("Could not select %s in the datepicker", desired_date)
+                    return False
 
             # Confirm selection
-            done_button = self.wait.until(
-                EC.element_to_be_clickable((By.XPATH, "//button[contains(@class, 'datepicker-button-primary') and contains(text(), 'Done')]"))
+            done_button = self.fast_wait.until(
+                EC.element_to_be_clickable(_SEL_DATEPICKER_DONE)
             )
             done_button.click()
 
             # Click search button
             search_button = self.wait.until(
-                EC.element_to_be_clickable((By.XPATH, "//button[contains(@id, 'frwebsearch_buttonsearch')]"))
+                EC.element_to_be_clickable(_SEL_SEARCH_BUTTON)
             )
             search_button.click()
-            time.sleep(1)  # Brief wait for UI update
+            # Results are ready to scan once the first date block renders
+            self.slow_wait.until(EC.presence_of_element_located(_SEL_DATEBLOCK))
             self._take_screenshot("post_date_selection")  # Add screenshot after date selection
 
-            self.logger.info(f"Date {desired_date} selected successfully")
+            self.logger.info("Date %s selected successfully", desired_date)
             return True
         except Exception as e:
             self._take_screenshot("date_selection_error")  # Add screenshot on date selection error
-            self.logger.error(f"Failed to select date: {str(e)}")
+            self.logger.error("Failed to select date: %s", e)
+            return False
+
+    def _pick_date_js(self, year, month_name, day):
+        """Select month, day and year in the open datepicker with a single execute_script call."""
+        selections = [
+            ["month_selection_button", month_name],
+            ["day_selection_button", str(day)],
+            ["year_selection_button", str(year)],
+        ]
+        try:
+            error = self.driver.execute_script(_PICK_DATE_JS, selections)
+        except Exception as e:
+            error = str(e)
+
+        if error:
+            self.logger.info("Batched date selection failed (%s), selecting dropdowns individually", error)
             return False
 
+        self.logger.info("Selected date options: %s %s %s", month_name, day, year)
+        return True
+
     def _select_dropdown_option(self, dropdown_id, value):
         """Select an option from a dropdown by its ID and value."""
         try:
             # Click the dropdown to open it
-            dropdown = self.wait.until(
-                EC.element_to_be_clickable((By.XPATH, f"//button[contains(@id, '{dropdown_id}')]"))
+            dropdown = self.fast_wait.until(
+                EC.element_to_be_clickable((By.CSS_SELECTOR, f"button[id*='{dropdown_id}']"))
             )
             dropdown.click()
 
-            # Select the option based on the value
-            option = self.wait.until(
-                EC.element_to_be_clickable((By.XPATH, f"//li[@role='option']//span[contains(@class, 'listitem__text') and text()='{value}']"))
+            # Each poll is a single script that returns the visible matching option, or null until it renders
+            option = self.fast_wait.until(
+                lambda driver: driver.execute_script(_FIND_OPTION_JS, str(value))
             )
             option.click()
 
-            self.logger.info(f"Selected option: {value}")
+            self.logger.info("Selected option: %s", value)
             return True
         except Exception as e:
-            self.logger.error(f"Failed to select dropdown option: {str(e)}")
+            self.logger.error("Failed to select dropdown option: %s", e)
             return False
 
     def _select_court(self):
         """Select a single court and time slot based on the sport type in the config file."""
         try:
-            desired_time = self.config['booking']['time']
-            facility_type = self.config['booking']['facility'].lower()
-            court_number = self.config['booking'].get('court_number', '')
+            facility_type = self._facility
+            court_number = self._booking.get('court_number', '')
+            target_time_slot = self._target_time_slot
 
-            self.logger.info(f"Looking for {facility_type} court (preferred court #{court_number if court_number else 'any'})")
-
-            # Parse desired time for one-hour slot
-            start_hour, _ = self._parse_time(desired_time)
-            end_hour = (start_hour + 1) % 24
-            
-            # Format the target time slot string
-            if start_hour < 12:
-                start_period = "am"
-            else:
-                start_period = "pm"
-                start_hour = start_hour % 12 if start_hour % 12 != 0 else 12
-                
-            if end_hour < 12:
-                end_period = "am"
-            else:
-                end_period = "pm"
-                end_hour = end_hour % 12 if end_hour % 12 != 0 else 12
-                
-            target_time_slot = f"{start_hour}:00 {start_period} - {end_hour}:00 {end_period}"
-            self.logger.info(f"Looking for time slot: {target_time_slot}")
+            self.logger.info("Looking for %s court (preferred court #%s)", facility_type, court_number if court_number else 'any')
+            self.logger.info("Looking for time slot: %s", target_time_slot)
 
-            # Wait for search results
-            self.wait.until(EC.presence_of_element_located((By.CLASS_NAME, "dateblock")))
-            time.sleep(1)
+            # _select_date already waited for the first results; wait for the list to stop growing instead of a fixed sleep
+            try:
+                WebDriverWait(self.driver, 5, poll_frequency=0.15).until(self._results_settled())
+            except TimeoutException:
+                self.logger.warning("Search results did not settle, continuing with what has rendered")
 
-            # Find all result content divs
-            result_contents = self.driver.find_elements(By.CLASS_NAME, "result-content")
-            self.logger.info(f"Found {len(result_contents)} court options")
+            # The facility keyword test and the normalized target do not depend on the court, so do them once
+            racquet_facility = any(keyword in facility_type for keyword in ["badminton", "pickle"])
+            target_norm = target_time_slot.lower()
 
-            for court_div in result_contents:
-                try:
-                    court_title = court_div.find_element(By.XPATH, ".//h2/span").text
-                    court_description = court_div.find_element(
-                        By.XPATH, 
-                        ".//div[contains(@class, 'result-header__description')]"
-                    ).text
-                    court_text = (court_title + " " + court_description).lower()
-                    self.logger.info(f"------------------------Checking court: {court_text}")
-                    # Calculate court score
-                    score = 0
-                    if facility_type in court_text:
-                        if any(keyword in facility_type for keyword in ["badminton", "pickle"]):
-                            if any(keyword in court_text for keyword in ["badminton", "pickle"]):
-                                # Look for the specific time slot
-                                time_slots = court_div.find_elements(
-                                    By.XPATH,
-                                    ".//a[contains(@data-tooltip, 'Book Now')]"  # Get all slots with data-tooltip
-                                )
-                                for slot in time_slots:
-                                    slot_text = slot.text.strip()
-                                    self.logger.info(f"------------------------Checking time slots: {slot_text}")
-                                    # Check if the slot is available (not having 'Unavailable' tooltip)
-                                    slot_status = "success" if slot.get_attribute("data-tooltip") != "Unavailable" else "error"
-                                    
-                                    # Remove extra spaces and standardize format
-                                    slot_text = ' '.join(slot_text.split())
-                                    self.logger.info(f"------------------------Checking time slots: {slot_text}")
-                                    
-                                    if slot_status == "success" and is_matching_time_slot(target_time_slot, slot_text):
-                                        self.logger.info(f"Found matching slot: {slot_text}")
-                                        best_slot=slot
-                                        break
-                        
+            # Find every court result and read its title, description and bookable slots in one round-trip
+            courts = self.driver.execute_script(_SCRAPE_COURTS_JS, _SEL_BOOKABLE_SLOTS[1])
+            self.logger.info("Found %s court options", len(courts))
 
-                except NoSuchElementException:
+            best_slot = None
+            best_slot_text = None
+            for court in courts:
+                if court['title'] is None or court['description'] is None:
                     continue
+                court_text = (court['title'] + " " + court['description']).lower()
+                self.logger.info("------------------------Checking court: %s", court_text)
+                if facility_type in court_text and racquet_facility:
+                    if any(keyword in court_text for keyword in ["badminton", "pickle"]):
+                        # Look for the specific time slot
+                        for slot in court['slots']:
+                            slot_text = slot['text']
+                            self.logger.info("------------------------Checking time slots: %s", slot_text)
+                            # Check if the slot is available (not having 'Unavailable' tooltip)
+                            if slot['tooltip'] == "Unavailable":
+                                continue
+                            # Slots normally render exactly like the target, so try that before parsing the range
+                            if slot_text.lower() == target_norm or is_matching_time_slot(target_time_slot, slot_text):
+                                self.logger.info("Found matching slot: %s", slot_text)
+                                best_slot = slot['element']
+                                best_slot_text = slot_text
+                                break
+                if best_slot:
+                    break
 
             if best_slot:
-                self.logger.info(f"Selected court: {best_slot.text}")
+                self.logger.info("Selected court: %s", best_slot_text)
                 self._take_screenshot("selected_court")
-                best_slot.click()
-                time.sleep(1)
+                self._click_and_wait(best_slot, _SEL_ADD_TO_CART)
 
                 # Verify only one item in cart
-                cart_items = self.driver.find_elements(
-                    By.XPATH, 
-                    "//div[contains(@class, 'cart-item')]"
-                )
+                cart_items = self.driver.find_elements(*_SEL_CART_ITEMS)
                 if len(cart_items) > 1:
                     self.logger.error("Multiple items detected in cart")
                     return False
 
                 return True
             else:
-                self.logger.error(f"No {facility_type} courts found with available slot at {target_time_slot}")
+                self.logger.error("No %s courts found with available slot at %s", facility_type, target_time_slot)
                 return False
 
         except Exception as e:
             self._take_screenshot("court_selection_error")
-            self.logger.error(f"Failed to select court and time: {str(e)}")
+            self.logger.error("Failed to select court and time: %s", e)
             return False
 
+    def _results_settled(self):
+        """Build a wait condition that holds once the number of court results is stable across two polls."""
+        last_count = [-1]
+
+        def condition(driver):
+            count = len(driver.find_elements(*_SEL_RESULT_CONTENT))
+            settled = (
+                count > 0
+                and count == last_count[0]
+                and driver.execute_script("return document.readyState") == "complete"
+            )
+            last_count[0] = count
+            return settled
+
+        return condition
+
+    def _build_time_slot(self, desired_time):
+        """Format the desired start time as the one-hour slot label shown in search results."""
+        start_hour, _ = self._parse_time(desired_time)
+        end_hour = (start_hour + 1) % 24
+        
+        # Format the target time slot string
+        if start_hour < 12:
+            start_period = "am"
+        else:
+            start_period = "pm"
+            start_hour = start_hour % 12 if start_hour % 12 != 0 else 12
+            
+        if end_hour < 12:
+            end_period = "am"
+        else:
+            end_period = "pm"
+            end_hour = end_hour % 12 if end_hour % 12 != 0 else 12
+            
+        return f"{start_hour}:00 {start_period} - {end_hour}:00 {end_period}"
+
     def _parse_time(self, desired_time):
         """Parse the desired time into 24-hour format."""
         clean_time = desired_time.strip().lower()
@@ -466,137 +1186,78 @@ class CourtBooker:
 
         return hour, minute
 
-    def _find_matching_courts(self, result_contents, facility_type, court_number, time_formats):
-        """Find courts matching the facility type and available time slots."""
-        court_matches = {}
-        for court_div in result_contents:
-            try:
-                court_title = court_div.find_element(By.XPATH, ".//h2/span").text
-                court_description = court_div.find_element(By.XPATH, ".//div[contains(@class, 'result-header__description')]").text
-                court_text = (court_title + " " + court_description).lower()
-                score = 0
-
-                if facility_type in court_text:
-                    score += 100
-                    if court_number and f"{facility_type} {court_number}" in court_text:
-                        score += 50
-                    if "badminton" in facility_type and "badminton" in court_text:
-                        score += 30
-                    if "pickle" in facility_type and "pickle" in court_text:
-                        score += 30
-
-                if score > 0:
-                    time_slots = court_div.find_elements(
-                        By.XPATH,
-                        ".//a[contains(@class, 'button') and contains(@class, 'cart-button')]"
-                    )
-                    available_slots = []
-                    for slot in time_slots:
-                        if "success" in slot.get_attribute("class"):
-                            slot_text = slot.text.strip()
-                            for time_format in time_formats:
-                                if time_format.lower() in slot_text.lower():
-                                    available_slots.append((slot, slot_text))
-                                    break
-
-                    if available_slots:
-                        score += 50
-                        court_matches[court_title] = {
-                            'div': court_div,
-                            'score': score,
-                            'slots': available_slots
-                        }
-                        self.logger.info(f"Found candidate court: {court_title} (Score: {score}) with {len(available_slots)} matching slots")
-                        self._take_screenshot("available_courts")  # Add screenshot of available courts
-
-            except NoSuchElementException as e:
-                self.logger.info(f"Error examining court: {str(e)}")
-                continue
-
-        return court_matches
-
     def _finalize_booking(self):
         """Complete the booking process by confirming the reservation."""
         try:
             self.logger.info("Confirming booking")
             self._take_screenshot("pre_finalization")  # Add screenshot before finalization
             
-            add_to_cart_button = self.wait.until(EC.element_to_be_clickable((By.XPATH, "//button[contains(@class, 'multiselectlist__addbutton') and .//span[contains(text(), 'Add To Cart')]]")))
+            add_to_cart_button = self.wait.until(EC.element_to_be_clickable(_SEL_ADD_TO_CART))
             add_to_cart_button.click()
 
             # Verify booking details
-            booking_header = self.wait.until(EC.presence_of_element_located((By.XPATH, "//h1[@id='processingprompts_header']")))
+            booking_header = self.wait.until(EC.presence_of_element_located(_SEL_PROCESSING_HEADER))
             header_text = booking_header.text
-            self.logger.info(f"Found booking header: {header_text}")
+            self.logger.info("Found booking header: %s", header_text)
 
             # Fill in required form fields
-            cell_number = self.config['booking'].get('cell_number', '')
-            booking_reason = self.config['booking'].get('booking_reason', '')
-
-            cell_field = self.wait.until(EC.presence_of_element_located((By.XPATH, "//input[@id='question150906610']")))
-            cell_field.clear()
-            cell_field.send_keys(cell_number)
-
-            reason_field = self.wait.until(EC.presence_of_element_located((By.XPATH, "//input[@id='question150906642']")))
-            reason_field.clear()
-            reason_field.send_keys(booking_reason)
+            cell_number = self._booking.get('cell_number', '')
+            booking_reason = self._booking.get('booking_reason', '')
+
+            # Wait for the form, then set both answers in one round-trip instead of typing them key by key
+            self.wait.until(EC.presence_of_element_located((By.ID, _CELL_NUMBER_FIELD)))
+            missing = self.driver.execute_script(_FILL_FIELDS_JS, [
+                [_CELL_NUMBER_FIELD, cell_number],
+                [_BOOKING_REASON_FIELD, booking_reason],
+            ])
+            if missing:
+                self.logger.info("Could not fill %s by script, typing instead", ', '.join(missing))
+                for field_id, value in ((_CELL_NUMBER_FIELD, cell_number), (_BOOKING_REASON_FIELD, booking_reason)):
+                    field = self.wait.until(EC.presence_of_element_located((By.ID, field_id)))
+                    field.clear()
+                    field.send_keys(value)
             self._take_screenshot("booking_form_filled")
 
             # Step 2: Click first continue button
-            continue_buttons = self.driver.find_elements(
-                By.XPATH,
-                "//button[contains(text(), 'Continue') or contains(text(), 'Next')] | " +
-                "//input[@value='Continue' or @value='Next']"
-            )
+            continue_buttons = self.driver.find_elements(*_SEL_CONTINUE_BUTTONS)
             if continue_buttons:
                 self.logger.info("Clicking first continue button")
-                continue_buttons[0].click()
-                time.sleep(1)
+                self._click_and_wait(continue_buttons[0], _SEL_CHECKOUT)
 
             # Step 3: Click "Proceed to Checkout" button
             try:
                 checkout_button = self.wait.until(
-                    EC.element_to_be_clickable((By.ID, "webcart_buttoncheckout"))
+                    EC.element_to_be_clickable(_SEL_CHECKOUT)
                 )
                 self.logger.info("Clicking 'Proceed to Checkout' button")
                 self._take_screenshot("pre_checkout")
-                checkout_button.click()
-                time.sleep(1)
+                self._click_and_wait(checkout_button, _SEL_CHECKOUT_CONTINUE)
             except Exception as e:
-                self.logger.error(f"Failed to click checkout button: {str(e)}")
+                self.logger.error("Failed to click checkout button: %s", e)
                 raise
 
             # Step 4: Click final continue button on checkout page
             try:
                 final_continue = self.wait.until(
-                    EC.element_to_be_clickable((By.ID, "webcheckout_buttoncontinue"))
+                    EC.element_to_be_clickable(_SEL_CHECKOUT_CONTINUE)
                 )
                 self.logger.info("Clicking final continue button")
                 self._take_screenshot("pre_final_confirmation")
-                final_continue.click()
-                time.sleep(1)
+                self._click_and_wait(final_continue)
             except Exception as e:
-                self.logger.error(f"Failed to click final continue button: {str(e)}")
+                self.logger.error("Failed to click final continue button: %s", e)
                 raise
 
             # Step 5: Verify booking confirmation
             try:
-                confirmation_element = self.wait.until(
-                    EC.presence_of_element_located((
-                        By.XPATH, 
-                        "//*[contains(text(), 'complete') or contains(text(), 'successful') or contains(text(), 'thank you')]"
-                    ))
-                )
+                confirmation_element = self.slow_wait.until(EC.presence_of_element_located(_SEL_CONFIRMATION_TEXT))
                 self._take_screenshot("booking_confirmed")
                 self.logger.info("Booking confirmed successfully")
                 
                 # Try to capture confirmation number if available
                 try:
-                    confirmation_number = self.driver.find_element(
-                        By.XPATH,
-                        "//div[@class='paragraph' and @id='webconfirmation_emailtext']//h3/text()"
-                    ).text
-                    self.logger.info(f"Booking confirmation number: {confirmation_number}")
+                    confirmation_number = self.driver.find_element(*_SEL_CONFIRMATION_NUMBER).text
+                    self.logger.info("Booking confirmation number: %s", confirmation_number)
                 except NoSuchElementException:
                     self.logger.info("No confirmation number found")
                     
@@ -609,7 +1270,7 @@ class CourtBooker:
 
         except Exception as e:
             self._take_screenshot("finalization_error")
-            self.logger.error(f"Failed to finalize booking: {str(e)}")
+            self.logger.error("Failed to finalize booking: %s", e)
             return False
 
     def _logout(self):
@@ -624,49 +1285,43 @@ class CourtBooker:
             # First, try the primary logout method (user menu dropdown)
             try:
                 # Click on the user menu that contains the SVG icon and username
-                user_menu = self.wait.until(
-                    EC.element_to_be_clickable((By.XPATH, "//span[contains(@class, 'menuitem__title') and contains(., '#')]"))
-                )
+                user_menu = self.wait.until(EC.element_to_be_clickable(_SEL_USER_MENU))
                 self.logger.info("Found user menu by class and ID")
                 user_menu.click()
 
                 # Click on the Logout option in the dropdown
                 logout_option = self.wait.until(
-                    EC.element_to_be_clickable((By.XPATH, "//span[contains(@class, 'menuitem__text') and text()='Logout']"))
+                    EC.element_to_be_clickable(_SEL_LOGOUT_OPTION)
                 )
                 self.logger.info("Found logout option")
                 logout_option.click()
 
                 # Wait for "Sign In / Register" to appear, confirming successful logout
-                self.wait.until(
-                    EC.presence_of_element_located((By.XPATH, "//span[@class='menuitem__text' and text()='Sign In / Register']"))
-                )
+                self._wait_for_element(_SEL_SIGN_IN)
 
                 self.logger.info("Logout successful - 'Sign In / Register' text found")
                 self.logged_in = False
                 return True
 
             except (TimeoutException, NoSuchElementException) as e:
-                self.logger.error(f"Could not find user menu: {str(e)}")
+                self.logger.error("Could not find user menu: %s", e)
 
                 # Fallback to alternative approach - look for any logout link
                 self.logger.info("Trying alternative logout approach")
                 try:
                     # Direct approach - try to find any logout link on the page
-                    logout_link = self.driver.find_element(By.XPATH, "//a[contains(text(), 'Log Out') or contains(text(), 'Logout')]")
+                    logout_link = self.driver.find_element(*_SEL_LOGOUT_LINK)
                     logout_link.click()
 
                     # Wait for "Sign In / Register" to appear
-                    self.wait.until(
-                        EC.presence_of_element_located((By.XPATH, "//span[@class='menuitem__text' and text()='Sign In / Register']"))
-                    )
+                    self._wait_for_element(_SEL_SIGN_IN)
 
                     self.logger.info("Direct logout successful - 'Sign In / Register' text found")
                     self.logged_in = False
                     return True
 
                 except Exception as direct_e:
-                    self.logger.error(f"Direct logout approach failed: {str(direct_e)}")
+                    self.logger.error("Direct logout approach failed: %s", direct_e)
 
                     # Last resort - try to navigate to the login page directly
                     try:
@@ -674,7 +1329,7 @@ class CourtBooker:
                         self.driver.get(self.config['login']['url'])
 
                         # Check for "Sign In / Register" presence
-                        sign_in_element = self.driver.find_elements(By.XPATH, "//span[@class='menuitem__text' and text()='Sign In / Register']")
+                        sign_in_element = self.driver.find_elements(*_SEL_SIGN_IN)
 
                         if sign_in_element or "login" in self.driver.current_url.lower():
                             self.logger.info("Forced logout by navigation successful")
@@ -685,88 +1340,220 @@ class CourtBooker:
                             return False
 
                     except Exception as nav_e:
-                        self.logger.error(f"Navigation approach failed: {str(nav_e)}")
+                        self.logger.error("Navigation approach failed: %s", nav_e)
                         return False
 
         except Exception as e:
-            self.logger.error(f"Logout failed: {str(e)}")
+            self.logger.error("Logout failed: %s", e)
             return False
 
 
-def get_valid_users():
+def read_config(path='config.ini') -> Optional[Dict[str, Dict[str, str]]]:
+    """
+    Parse the config file once per process and return its sections as plain dicts.
+
+    Args:
+        path: Config file to read on the first call
+
+    Returns:
+        Mapping of section name to its options, or None if the file could not be read
+    """
+    global _CONFIG_CACHE
+    # Every booking thread asks for the config at start-up; only the first one parses it
+    with _CONFIG_LOCK:
+        if _CONFIG_CACHE is None:
+            parser = configparser.ConfigParser()
+            if not parser.read(path):
+                return None
+            _CONFIG_CACHE = {name: dict(parser[name]) for name in parser.sections()}
+        return _CONFIG_CACHE
+
+
+def _login_host(user, config=None):
+    """Return the hostname of a user's login URL, or an empty string if it has none."""
+    login_url = (config or read_config() or {}).get(f"{user}_LOGIN", {}).get('url', '')
+    return urlparse(login_url).hostname or ''
+
+
+def _host_semaphore(host):
+    """Return the semaphore limiting concurrent sessions against one booking host."""
+    with _HOST_SEMAPHORES_LOCK:
+        semaphore = _HOST_SEMAPHORES.get(host)
+        if semaphore is None:
+            semaphore = _HOST_SEMAPHORES[host] = threading.BoundedSemaphore(MAX_SESSIONS_PER_HOST)
+        return semaphore
+
+
+def _write_file(path, data):
+    """Write bytes to a file; runs on the screenshot writer threads."""
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def get_valid_users(config=None):
     """Extract all valid user prefixes from the config file."""
-    config = configparser.ConfigParser()
-    config.read('config.ini')
+    if config is None:
+        config = read_config() or {}
 
     users = []
-    for section in config.sections():
+    for section in config:
         if section.endswith('_LOGIN'):
             user_prefix = section[:-6]
-            if f"{user_prefix}_BOOKING" in config.sections():
+            if f"{user_prefix}_BOOKING" in config:
                 users.append(user_prefix)
     return users
 
 
-def process_user(user: str, args: argparse.Namespace) -> Tuple[str, bool, str]:
+def process_user(user: str, args: argparse.Namespace, config: Optional[Dict[str, Dict[str, str]]] = None,
+                 pool: Optional[WebDriverPool] = None) -> Tuple[str, bool, str, float]:
     """
     Process booking for a single user.
     
     Args:
         user: User prefix
         args: Command line arguments
+        config: Parsed config.ini shared across users
+        pool: Warm browsers to borrow from instead of launching one for this user; defaults to
+            the worker's own pool when running in a --processes worker
         
     Returns:
-        Tuple of (user, success boolean, error message if any)
+        Tuple of (user, success boolean, error message if any, seconds the booking itself took)
     """
+    if pool is None:
+        pool = _WORKER_POOL
+    driver = None
+    # Timed here rather than at submission, so waiting in the executor's queue isn't read as a slow site
+    started = time.monotonic()
     try:
+        if pool is not None:
+            driver = pool.acquire()
         booker = CourtBooker(
+            driver=driver,
             user_prefix=user,
             headless=args.headless,
             suppress_console=args.quiet,
             take_screenshots=args.screenshots,
-            use_config_date=args.use_config_date
+            use_config_date=args.use_config_date,
+            config_obj=config,
+            keep_session=args.keep_session,
+            logout_on_exit=args.logout,
+            all_screenshots=args.all_screenshots,
+            http_login=args.http_login
         )
         success = booker.execute_booking()
-        return user, success, ""
+        return user, success, "", time.monotonic() - started
     except Exception as e:
         error_msg = f"Error: {str(e)}\n{traceback.format_exc()}"
-        return user, False, error_msg
+        return user, False, error_msg, time.monotonic() - started
+    finally:
+        if driver is not None:
+            pool.release(driver)
+
+def _init_worker(browser_kwargs):
+    """ProcessPoolExecutor initializer that gives the worker one browser to reuse across its bookings."""
+    global _WORKER_POOL
+    _WORKER_POOL = WebDriverPool(1, **browser_kwargs)
+    # Worker processes exit without running atexit hooks, so quit the browser from multiprocessing's own
+    multiprocessing.util.Finalize(_WORKER_POOL, _WORKER_POOL.close, exitpriority=10)
 
 def main():
     parser = argparse.ArgumentParser(description="Multi-user Court Booking System")
     parser.add_argument("--headless", action="store_true", help="Run in headless mode")
     parser.add_argument("--quiet", action="store_true", help="Suppress console output")
     parser.add_argument("--screenshots", action="store_true", help="Enable screenshots")
+    parser.add_argument("--all-screenshots", action="store_true", help="With --screenshots, capture every step instead of only checkpoints and errors")
     parser.add_argument("--use-config-date", action="store_true", help="Use config dates")
+    parser.add_argument("--keep-session", action="store_true", help="Reuse a persistent browser profile and stay logged in between runs")
+    parser.add_argument("--logout", action="store_true", help="Log out of the site before closing the browser")
+    parser.add_argument("--http-login", action="store_true", help="Try logging in with a direct HTTP POST before using the login form")
     parser.add_argument("--max-workers", type=int, default=3, help="Maximum number of parallel bookings")
+    parser.add_argument("--processes", action="store_true", help="Run bookings in worker processes, each reusing its own browser, instead of threads")
+    parser.add_argument("--target-latency", type=float, default=120.0, help="Booking duration in seconds above which concurrency backs off")
     args = parser.parse_args()
 
+    # Parse config.ini once and share it, so every user sees the same snapshot of the file
+    config = read_config() or {}
+
     # Get all valid users from the config file
-    users = get_valid_users()
+    users = get_valid_users(config)
     if not users:
         print("No valid user configurations found")
         return
 
     results: Dict[str, Tuple[bool, str]] = {}
+    # Each user gets its own browser session, so there is no point in more workers than users
+    max_workers = max(1, min(args.max_workers, len(users)))
     
-    print(f"Starting parallel booking for {len(users)} users with {args.max_workers} workers")
+    print(f"Starting parallel booking for {len(users)} users with {max_workers} workers")
     
-    # Use ThreadPoolExecutor for parallel processing
-    with concurrent.futures.ThreadPoolExecutor(max_workers=args.max_workers) as executor:
-        # Submit all booking tasks
-        future_to_user = {
-            executor.submit(process_user, user, args): user 
-            for user in users
-        }
-        
-        # Process completed tasks as they finish
-        for future in concurrent.futures.as_completed(future_to_user):
-            user, success, error = future.result()
-            results[user] = (success, error)
-            status = "Success" if success else "Failed"
-            print(f"\nBooking {status} for {user}")
-            if error:
-                print(f"Error details for {user}:\n{error}")
+    # Threads share one pool of warm browsers, while each worker process keeps its own; per-user
+    # profiles need a fresh browser every time
+    browser_kwargs = dict(headless=args.headless, suppress_console=args.quiet, take_screenshots=args.screenshots)
+    pool = None
+    executor_kwargs = {}
+    if args.processes:
+        executor_cls = concurrent.futures.ProcessPoolExecutor
+        if not args.keep_session:
+            executor_kwargs = dict(initializer=_init_worker, initargs=(browser_kwargs,))
+    else:
+        executor_cls = concurrent.futures.ThreadPoolExecutor
+        if not args.keep_session:
+            pool = WebDriverPool(max_workers, **browser_kwargs)
+
+    # max_workers caps concurrency; the limiter backs off below it when the site errors or slows down
+    limiter = AdaptiveConcurrency(max_workers, target_latency=args.target_latency)
+
+    # Sessions per booking host are capped here, at submission, so the cap holds for worker processes
+    # too; each job keeps its host's slot until its future is done
+    host_released = threading.Condition()
+
+    def admit_next(pending):
+        """Take the first pending user whose host has a free session slot, waiting until one does."""
+        with host_released:
+            while True:
+                for user in pending:
+                    if _host_semaphore(_login_host(user, config)).acquire(blocking=False):
+                        pending.remove(user)
+                        return user
+                host_released.wait()
+
+    def on_done(future, user, submitted):
+        _host_semaphore(_login_host(user, config)).release()
+        with host_released:
+            host_released.notify_all()
+        if future.exception() is not None:
+            limiter.release(time.monotonic() - submitted, True)
+        else:
+            # execute_booking absorbs Selenium timeouts and WebDriver errors into a False result, so an
+            # unsuccessful booking is the signal that the site is struggling, not only a crash
+            _, success, error, latency = future.result()
+            limiter.release(latency, not success or bool(error))
+
+    try:
+        with executor_cls(max_workers=max_workers, **executor_kwargs) as executor:
+            # Submit booking tasks as the limiter and the per-host cap admit them
+            future_to_user = {}
+            pending = deque(users)
+            while pending:
+                limiter.acquire()
+                user = admit_next(pending)
+                submitted = time.monotonic()
+                future = executor.submit(process_user, user, args, config, pool)
+                future.add_done_callback(functools.partial(on_done, user=user, submitted=submitted))
+                future_to_user[future] = user
+            
+            # Process completed tasks as they finish
+            for future in concurrent.futures.as_completed(future_to_user):
+                user, success, error, _ = future.result()
+                results[user] = (success, error)
+                status = "Success" if success else "Failed"
+                print(f"\nBooking {status} for {user}")
+                if error:
+                    print(f"Error details for {user}:\n{error}")
+    finally:
+        # Quit the warm browsers even if the run is interrupted, so no Chrome is left behind
+        if pool is not None:
+            pool.close()
 
     # Print final summary
     print("\nBooking Results Summary:")
@@ -790,54 +1577,56 @@ def is_matching_time_slot(start_time_str, time_range_str):
     Returns:
         bool: True if the start time represents the same one-hour slot as the time range
     """
-    # Normalize strings by removing extra spaces and converting to lowercase
-    start_time = start_time_str.lower().replace(" ", "")
-    time_range = time_range_str.lower().replace(" ", "")
-    
+    # Normalize strings by removing extra spaces and converting to lowercase, so equivalent
+    # spellings share one cache entry
+    return _match_normalized_slot(start_time_str.lower().replace(" ", ""), time_range_str.lower().replace(" ", ""))
+
+
+@functools.lru_cache(maxsize=1024)
+def _match_normalized_slot(start_time, time_range):
+    """Cached core of is_matching_time_slot; both arguments are lowercase with spaces removed."""
     # Parse start_time to extract hour and am/pm
-    if ":" in start_time:
-        start_hour_str = start_time.split(":")[0]
-        start_period = "am" if "am" in start_time else "pm"
-    else:
-        # Handle case without colon
-        digit_part = ''.join(filter(str.isdigit, start_time))
-        start_hour_str = digit_part
-        start_period = "am" if "am" in start_time else "pm"
-    
-    start_hour = int(start_hour_str)
-    
-    # Convert to 24-hour format
-    if start_period == "pm" and start_hour < 12:
-        start_hour += 12
-    elif start_period == "am" and start_hour == 12:
-        start_hour = 0
-    
-    # Calculate end hour (one hour later)
-    end_hour = (start_hour + 1) % 24
-    
-    # Format back to 12-hour for comparison
-    start_hour_12 = start_hour if start_hour <= 12 else start_hour - 12
-    start_hour_12 = 12 if start_hour_12 == 0 else start_hour_12
-    
-    end_hour_12 = end_hour if end_hour <= 12 else end_hour - 12
-    end_hour_12 = 12 if end_hour_12 == 0 else end_hour_12
-    
-    end_period = "am" if end_hour < 12 else "pm"
-    
-    # Create normalized expected time range patterns to check against
-    # Format 1: "6:00pm-7:00pm"
-    expected_pattern1 = f"{start_hour_12}:00{start_period}-{end_hour_12}:00{end_period}"
-    # Format 2: "6pm-7pm"
-    expected_pattern2 = f"{start_hour_12}{start_period}-{end_hour_12}{end_period}"
-    
-    # Remove all spaces for comparison
-    normalized_range = time_range.replace(" ", "")
-    
-    # Check if the normalized time range matches any of our expected patterns
-    return (expected_pattern1 in normalized_range or 
-            expected_pattern2 in normalized_range or
-            f"{start_hour_12}:00{start_period}" in normalized_range.split("-")[0])
+    match = _TIME_RE.match(start_time)
+    if not match:
+        raise ValueError(f"Unrecognized start time: {start_time!r}")
+    start_period = match.group(3) or ("am" if "am" in start_time else "pm")
+    # Check if the normalized time range matches the expected slot in one scan
+    return _slot_pattern(int(match.group(1)), start_period).search(time_range) is not None
+
+
+def _slot_pattern(start_hour, start_period):
+    """
+    Look up the regex matching ranges for a slot starting at the given hour, compiling it on first use.
+
+    Args:
+        start_hour (int): Hour as written in the start time
+        start_period (str): "am" or "pm"
+
+    Returns:
+        re.Pattern: Matches "6:00pm-7:00pm" or "6pm-7pm" anywhere, or "6:00pm" before the first "-"
+    """
+    key = (start_hour, start_period)
+    pattern = _SLOT_TABLE.get(key)
+    if pattern is not None:
+        return pattern
+
+    # Convert to 24-hour format and back with modular arithmetic; 12am is hour 0 and 12pm is hour 12
+    start_hour_24 = start_hour % 12 + (12 if start_period == "pm" else 0)
+    start_hour_12 = (start_hour_24 + 11) % 12 + 1
 
+    # Calculate end hour (one hour later)
+    end_hour = (start_hour_24 + 1) % 24
+    end_hour_12 = (end_hour + 11) % 12 + 1
+    end_period = "pm" if end_hour >= 12 else "am"
+
+    pattern = re.compile(
+        # "6:00pm-7:00pm" or "6pm-7pm" (the ":00" is optional on either side)
+        rf"{start_hour_12}(?::00)?{start_period}-{end_hour_12}(?::00)?{end_period}"
+        # Start time alone, matched against the first half of the range
+        rf"|^[^-]*{start_hour_12}:00{start_period}"
+    )
+    _SLOT_TABLE[key] = pattern
+    return pattern
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,56 +1,134 @@
+import functools
 import json
 import os
-from datetime import datetime, timedelta
-import pytz
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 
-def parse_logs(user_prefix):
+# build_cache lives at the repository root, next to dashboard.py, which shares it
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import build_cache
+
+try:
+    import orjson
+except ImportError:  # Optional, status.json is written with the stdlib json module instead
+    orjson = None
+
+_STATUS_FILE = "dashboard/status.json"
+# Last parsed entry per log, keyed by path and stamped with the log's mtime and size
+_PARSE_CACHE_FILE = build_cache.cache_path("parse_cache.json")
+
+# Bytes read per step when scanning backwards from the end of a log for its last line
+_TAIL_CHUNK = 4096
+
+def _read_last_line(log_path):
+    """Return the last line of a log file, reading back from the end instead of loading all of it."""
+    with open(log_path, 'rb') as f:
+        end = f.seek(0, os.SEEK_END)
+        pos = end
+        tail = b""
+        # Grow the tail a chunk at a time until it holds a full line (or the whole file)
+        while pos > 0:
+            pos = max(0, pos - _TAIL_CHUNK)
+            f.seek(pos)
+            tail = f.read(end - pos)
+            if tail.rstrip(b"\r\n").count(b"\n") >= 1:
+                break
+    lines = tail.splitlines()
+    return lines[-1].decode('utf-8', errors='replace') if lines else ""
+
+def _load_parse_cache():
+    """Load the previous run's {log path: [[mtime_ns, size], status entry]} map, or {} if missing or corrupt."""
+    return build_cache.load_json_cache(_PARSE_CACHE_FILE)
+
+def _save_parse_cache(cache):
+    """Write this run's status entries, each stamped with the mtime_ns and size its log had when parsed."""
+    build_cache.save_json_cache(_PARSE_CACHE_FILE, cache)
+
+def parse_logs(user_prefix, cache=None):
     log_path = f"logs/{user_prefix}.log"
     status = "Pending"
     details = ""
-    timestamp = datetime.now(pytz.utc).isoformat()
+    timestamp = datetime.now(timezone.utc).isoformat()
+    last_line = ""
     
-    if os.path.exists(log_path):
-        with open(log_path, 'r') as f:
-            lines = f.readlines()
-            if lines:
-                last_line = lines[-1]
-                timestamp_str = last_line.split(' - ')[0]
-                timestamp = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S,%f').isoformat()
-                
-                if "Booking failed" in last_line:
-                    status = "Failed"
-                    details = last_line.split(' - ')[-1].strip()
-                elif "Booking finalized successfully" in last_line:
-                    status = "Success"
-                else:
-                    status = "Pending"
-
-    return {
+    try:
+        st = os.stat(log_path)
+    except OSError:
+        st = None
+
+    if st is not None:
+        # A log that has not been written to since the last run parses to the same entry
+        stamp = [st.st_mtime_ns, st.st_size]
+        cached = cache.get(log_path) if cache is not None else None
+        if cached and cached[0] == stamp:
+            return cached[1]
+
+        last_line = _read_last_line(log_path)
+        if last_line:
+            timestamp_str = last_line.split(' - ')[0]
+            # logging's "2024-01-02 03:04:05,123" is ISO format once the comma becomes a dot, and
+            # fromisoformat is implemented in C, unlike strptime's format interpreter
+            timestamp = datetime.fromisoformat(timestamp_str.replace(',', '.', 1)).isoformat()
+            
+            if "Booking failed" in last_line:
+                status = "Failed"
+                details = last_line.split(' - ')[-1].strip()
+            elif "Booking finalized successfully" in last_line:
+                status = "Success"
+            else:
+                status = "Pending"
+
+    entry = {
         "user": user_prefix,
         "status": status,
         "timestamp": timestamp,
         "details": details
     }
+    # Entries without a log line carry the current time, so they are worth re-reading next run
+    if cache is not None and last_line:
+        cache[log_path] = [stamp, entry]
+    return entry
 
 def generate_status():
     users = []
-    # Get all user log files
-    for filename in os.listdir("logs"):
-        if filename.endswith(".log"):
-            user_prefix = filename.split('.')[0]
-            users.append(user_prefix)
+    seen = set()
+    # Get all user log files, skipping duplicate prefixes as they are found
+    with os.scandir("logs") as entries:
+        for entry in entries:
+            if entry.name.endswith(".log") and entry.is_file():
+                user_prefix = entry.name.split('.')[0]
+                if user_prefix not in seen:
+                    seen.add(user_prefix)
+                    users.append(user_prefix)
     
-    # Remove duplicates
-    users = list(set(users))
-    
-    status = [parse_logs(user) for user in users]
+    # Only entries for logs that still exist are carried over to the next run
+    previous = _load_parse_cache()
+    cache = {}
+    for user in users:
+        log_path = f"logs/{user}.log"
+        if log_path in previous:
+            cache[log_path] = previous[log_path]
+
+    # Reading the logs is I/O bound, so read them side by side; results stay in user order.
+    # Each worker only touches its own user's cache key
+    status = []
+    if users:
+        with ThreadPoolExecutor(max_workers=min(32, len(users))) as executor:
+            status = list(executor.map(functools.partial(parse_logs, cache=cache), sorted(users)))
     
-    # Create dashboard directory if not exists
-    if not os.path.exists("dashboard"):
-        os.makedirs("dashboard")
+    # Create dashboard directory if not exists; exist_ok also avoids racing a concurrent run
+    os.makedirs("dashboard", exist_ok=True)
+    _save_parse_cache(cache)
     
-    with open("dashboard/status.json", "w") as f:
-        json.dump(status, f, indent=2)
+    if orjson is not None:
+        payload = orjson.dumps(status, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(status, indent=2).encode()
+
+    # Write beside the real file and rename over it, so a reader never sees a half-written status;
+    # the pid keeps two concurrent runs from sharing a temp file
+    build_cache.write_atomic(_STATUS_FILE, payload)
 
 if __name__ == "__main__":
     generate_status()
\ No newline at end of file